@@ -1,38 +1,38 @@
 """Main CLI application — app setup, argv preprocessing, and entry point."""
 
 import sys
+from functools import lru_cache
+from importlib import import_module
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
+from typer.core import TyperGroup
 
-from drift_cli.commands.history_cmd import history_app
-from drift_cli.commands.memory_cmd import memory_app
-from drift_cli.commands.suggest_cmd import suggest_app
-from drift_cli.commands.system_cmd import system_app
 from drift_cli.core.first_run import is_first_run, run_setup_wizard
 
 # ---------------------------------------------------------------------------
-# Known subcommands for argv preprocessing
+# Subcommand → (module, Typer app) table; modules are imported on first use
 # ---------------------------------------------------------------------------
-_SUBCOMMANDS = {
-    "suggest",
-    "find",
-    "explain",
-    "history",
-    "again",
-    "undo",
-    "cleanup",
-    "doctor",
-    "config",
-    "uninstall",
-    "update",
-    "version",
-    "setup",
-    "memory",
+_COMMAND_MODULES = {
+    "suggest": ("suggest_cmd", "suggest_app"),
+    "find": ("suggest_cmd", "suggest_app"),
+    "explain": ("suggest_cmd", "suggest_app"),
+    "history": ("history_cmd", "history_app"),
+    "again": ("history_cmd", "history_app"),
+    "undo": ("history_cmd", "history_app"),
+    "cleanup": ("history_cmd", "history_app"),
+    "doctor": ("system_cmd", "system_app"),
+    "config": ("system_cmd", "system_app"),
+    "setup": ("system_cmd", "system_app"),
+    "update": ("system_cmd", "system_app"),
+    "uninstall": ("system_cmd", "system_app"),
+    "version": ("system_cmd", "system_app"),
+    "memory": ("memory_cmd", "memory_app"),
 }
 
-_QUERY_SUBCOMMANDS = {"suggest", "find", "explain"}
+# Known subcommands for argv preprocessing
+_SUBCOMMANDS = frozenset(_COMMAND_MODULES)
+
+_QUERY_SUBCOMMANDS = frozenset({"suggest", "find", "explain"})
 
 
 def _preprocess_argv():
@@ -49,37 +49,54 @@ def _preprocess_argv():
 
     first = args[0]
 
-    if not first.startswith("-") and first not in _SUBCOMMANDS:
+    if first[:1] != "-" and first not in _SUBCOMMANDS:
         query = " ".join(args)
         sys.argv = [sys.argv[0], "suggest", query]
         return
 
     if first in _QUERY_SUBCOMMANDS and len(args) > 1:
-        options = [a for a in args[1:] if a.startswith("-")]
-        positional = [a for a in args[1:] if not a.startswith("-")]
+        # One pass: split flags from query words, keeping each group's order
+        options, positional = [], []
+        for arg in args[1:]:
+            (options if arg[:1] == "-" else positional).append(arg)
         if len(positional) > 1:
-            query = " ".join(positional)
-            sys.argv = [sys.argv[0], first] + options + [query]
+            sys.argv = [sys.argv[0], first, *options, " ".join(positional)]
 
 
 # ---------------------------------------------------------------------------
 # Typer app — register all command groups
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _load_group(module_name: str, app_name: str):
+    """Import a command module and convert its Typer app to a click command."""
+    module = import_module(f"drift_cli.commands.{module_name}")
+    return typer.main.get_command(getattr(module, app_name))
+
+
+class _LazyGroup(TyperGroup):
+    """Resolves subcommands from _COMMAND_MODULES, importing only the one invoked."""
+
+    def list_commands(self, ctx):
+        return list(_COMMAND_MODULES)
+
+    def get_command(self, ctx, cmd_name):
+        target = _COMMAND_MODULES.get(cmd_name)
+        if target is None:
+            return None
+        group = _load_group(*target)
+        if cmd_name == "memory":
+            return group
+        return group.get_command(ctx, cmd_name)
+
+
 app = typer.Typer(
     name="drift",
     help="Terminal-native, safety-first AI assistant",
     add_completion=False,
     invoke_without_command=True,
+    cls=_LazyGroup,
 )
 
-for _sub_app in (suggest_app, history_app, system_app):
-    for cmd_info in _sub_app.registered_commands:
-        app.registered_commands.append(cmd_info)
-
-app.add_typer(memory_app, name="memory")
-
-console = Console()
-
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
@@ -97,15 +114,14 @@ def main(ctx: typer.Context):
 # ---------------------------------------------------------------------------
 # Rich help screen
 # ---------------------------------------------------------------------------
-def _show_help():
-    """Show a rich help screen with all commands."""
-    from drift_cli import __version__
-
-    console.print(f"\n[bold cyan]Drift CLI[/bold cyan] [dim]v{__version__}[/dim]")
-    console.print("[dim]Terminal-native, safety-first AI assistant[/dim]\n")
-
-    console.print(
-        Panel(
+@lru_cache(maxsize=1)
+def _commands_panel():
+    """Build the commands panel once; markup is parsed up front."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(
             "[cyan]drift[/cyan] [dim]list large files[/dim]     Quick shortcut (same as suggest)\n"
             "[cyan]drift suggest[/cyan] [dim]<query>[/dim]       AI command suggestions\n"
             "[cyan]drift explain[/cyan] [dim]<cmd>[/dim]         Explain a shell command\n"
@@ -120,36 +136,75 @@ def _show_help():
             "[cyan]drift setup[/cyan]                  Run setup wizard\n"
             "[cyan]drift update[/cyan]                 Update to latest version\n"
             "[cyan]drift uninstall[/cyan]              Remove Drift & data\n"
-            "[cyan]drift version[/cyan]                Show version",
-            title="[bold]Commands[/bold]",
-            border_style="cyan",
-        )
+            "[cyan]drift version[/cyan]                Show version"
+        ),
+        title="[bold]Commands[/bold]",
+        border_style="cyan",
     )
 
-    console.print(
-        Panel(
+
+@lru_cache(maxsize=1)
+def _slash_panel():
+    """Build the slash commands panel once."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(
             "[cyan]/git[/cyan]    Next git action     [cyan]/commit[/cyan]  Smart commit\n"
             "[cyan]/find[/cyan]   Search files        [cyan]/fix[/cyan]     Fix recent errors\n"
             "[cyan]/test[/cyan]   Run project tests   [cyan]/build[/cyan]   Build project\n"
             "[cyan]/dev[/cyan]    Start dev server    [cyan]/clean[/cyan]   Clean artifacts\n"
             "[cyan]/deps[/cyan]   Check dependencies  [cyan]/lint[/cyan]    Run linter\n"
             "[cyan]/tree[/cyan]   Directory tree      [cyan]/tips[/cyan]    Workflow tips\n"
-            "\n[dim]Usage: drift /git  or  drift suggest /commit[/dim]",
-            title="[bold]Slash Commands[/bold]",
-            border_style="yellow",
-        )
+            "\n[dim]Usage: drift /git  or  drift suggest /commit[/dim]"
+        ),
+        title="[bold]Slash Commands[/bold]",
+        border_style="yellow",
     )
 
-    console.print(
-        Panel(
+
+@lru_cache(maxsize=1)
+def _flags_panel():
+    """Build the suggest flags panel once."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(
+        Text.from_markup(
             "[dim]-e, --execute[/dim]    Run without confirmation\n"
             "[dim]-d, --dry-run[/dim]    Preview only, don't execute\n"
             "[dim]-v, --verbose[/dim]    Show detailed explanation\n"
-            "[dim]--no-memory[/dim]      Disable personalization",
-            title="[bold]Flags (for suggest)[/bold]",
-            border_style="dim",
-        )
+            "[dim]--no-memory[/dim]      Disable personalization"
+        ),
+        title="[bold]Flags (for suggest)[/bold]",
+        border_style="dim",
+    )
+
+
+@lru_cache(maxsize=1)
+def _header():
+    """Build the version banner once."""
+    from rich.text import Text
+
+    from drift_cli import __version__
+
+    return Text.from_markup(
+        f"\n[bold cyan]Drift CLI[/bold cyan] [dim]v{__version__}[/dim]\n"
+        "[dim]Terminal-native, safety-first AI assistant[/dim]\n"
     )
+
+
+def _show_help():
+    """Show a rich help screen with all commands."""
+    from rich.console import Console
+
+    console = Console()
+
+    console.print(_header())
+    console.print(_commands_panel())
+    console.print(_slash_panel())
+    console.print(_flags_panel())
     console.print()
 
 
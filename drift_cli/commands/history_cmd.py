@@ -1,12 +1,11 @@
 """History, undo, again, and cleanup commands."""
 
-from pathlib import Path
+import os
 
 import typer
 from rich.console import Console
 
-from drift_cli.core.history import HistoryManager
-from drift_cli.ui.display import DriftUI
+from drift_cli.core.paths import CACHE_DB, SNAPSHOTS_DIR
 
 console = Console()
 
@@ -18,7 +17,10 @@ def history(
     limit: int = typer.Option(10, "--limit", "-n", help="Number of entries to show"),
 ):
     """View Drift command history."""
-    hist = HistoryManager()
+    from drift_cli.core.history import get_history_manager
+    from drift_cli.ui.display import DriftUI
+
+    hist = get_history_manager()
     entries = hist.get_history(limit=limit)
 
     console.print()
@@ -28,9 +30,11 @@ def history(
 @history_app.command("again")
 def again():
     """Re-run the last Drift command."""
-    from drift_cli.commands.suggest_cmd import suggest
+    from drift_cli.commands.suggest_cmd import _build_deps, _run_suggest
+    from drift_cli.core.history import get_history_manager
+    from drift_cli.ui.display import DriftUI
 
-    hist = HistoryManager()
+    hist = get_history_manager()
     last = hist.get_last_entry()
 
     if not last:
@@ -39,13 +43,20 @@ def again():
 
     DriftUI.show_info(f"Re-running: {last.query}")
     console.print()
-    suggest(query=last.query, execute=False, dry_run=False)
+    deps = _build_deps(history=hist)
+    try:
+        _run_suggest(last.query, deps)
+    finally:
+        deps.close()
 
 
 @history_app.command("undo")
 def undo():
     """Restore files from the last operation."""
-    hist = HistoryManager()
+    from drift_cli.core.history import get_history_manager
+    from drift_cli.ui.display import DriftUI
+
+    hist = get_history_manager()
     last = hist.get_last_entry()
 
     if not last or not last.executed:
@@ -77,27 +88,44 @@ def cleanup(
     auto: bool = typer.Option(False, "--auto", "-a", help="Skip confirmation"),
 ):
     """Clean up old snapshots and free disk space."""
-    hist = HistoryManager()
-    snapshots_dir = Path.home() / ".drift" / "snapshots"
-
-    if not snapshots_dir.exists():
+    from drift_cli.core.history import count_snapshots, get_history_manager
+    from drift_cli.ui.display import DriftUI
+
+    if os.path.exists(CACHE_DB):
+        from drift_cli.core.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        purged = cache.purge()
+        cache.close()
+        if purged:
+            DriftUI.show_info(f"Purged {purged} stale cached responses")
+
+    # Only a cheap count up front; sizes are measured while deleting, so a
+    # cancelled cleanup never walks the snapshot tree.
+    snapshot_count = count_snapshots(SNAPSHOTS_DIR)
+    if not snapshot_count:
         DriftUI.show_info("No snapshots to clean up")
         return
+    console.print(f"[cyan]Snapshots: {snapshot_count}[/cyan]")
+
+    if snapshot_count <= keep:
+        DriftUI.show_info("Nothing to clean up")
+        return
 
-    total_size = sum(f.stat().st_size for f in snapshots_dir.rglob("*") if f.is_file())
-    total_mb = total_size / (1024 * 1024)
-    snapshot_count = len(list(snapshots_dir.iterdir()))
-    console.print(f"[cyan]Snapshots: {snapshot_count} ({total_mb:.1f} MB)[/cyan]")
+    hist = get_history_manager()
 
     if not auto:
         if not typer.confirm(f"Delete snapshots older than {days} days (keep {keep})?"):
             return
 
-    deleted = hist.cleanup_old_snapshots(keep=keep, max_age_days=days)
+    deleted, freed_bytes = hist.cleanup_old_snapshots(keep=keep, max_age_days=days)
 
     if deleted > 0:
-        new_size = sum(f.stat().st_size for f in snapshots_dir.rglob("*") if f.is_file())
-        freed = total_mb - new_size / (1024 * 1024)
-        DriftUI.show_success(f"Deleted {deleted} snapshots, freed {freed:.1f} MB")
+        freed = freed_bytes / (1024 * 1024)
+        # Derived from the up-front count, so there is no second walk
+        remaining = snapshot_count - deleted
+        DriftUI.show_success(
+            f"Deleted {deleted} snapshots, freed {freed:.1f} MB ({remaining} remaining)"
+        )
     else:
         DriftUI.show_info("Nothing to clean up")
@@ -1,30 +1,36 @@
 """Memory management CLI commands."""
 
-import typer
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+import heapq
+from operator import itemgetter
+from pathlib import Path
+from typing import Optional
 
-from drift_cli.core.history import HistoryManager
-from drift_cli.core.memory import MemoryManager
+import typer
+from rich.console import Console, Group
 
 console = Console()
-memory_app = typer.Typer(help="Manage Drift's memory and learned preferences")
+memory_app = typer.Typer(help="Manage Drift's memory and learned preferences", add_completion=False)
 
 
 @memory_app.command("show")
 def show_memory():
     """Show what Drift has learned about your preferences."""
-    memory = MemoryManager()
-    history_manager = HistoryManager()
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from drift_cli.core.history import get_history_manager
+    from drift_cli.core.memory import get_memory_manager
+
+    memory = get_memory_manager()
+    history_manager = get_history_manager()
 
     # Learn from history first
     history = history_manager.get_history(limit=100)
     if history:
         memory.learn_from_history(history)
 
-    console.print("\n[bold cyan]🧠 Drift Memory - What I've Learned About You[/bold cyan]\n")
+    renderables = ["\n[bold cyan]🧠 Drift Memory - What I've Learned About You[/bold cyan]\n"]
 
     # User Preferences
     prefs_table = Table(title="Your Preferences", box=box.ROUNDED)
@@ -45,8 +51,7 @@ def show_memory():
         "Verbose" if memory.preferences.prefers_verbose_explanations else "Concise",
     )
 
-    console.print(prefs_table)
-    console.print()
+    renderables += [prefs_table, ""]
 
     # Favorite Tools
     if memory.preferences.favorite_tools:
@@ -58,8 +63,7 @@ def show_memory():
         for i, tool in enumerate(memory.preferences.favorite_tools[:10], 1):
             tools_table.add_row(str(i), tool, "⭐" * min(5, 6 - i))
 
-        console.print(tools_table)
-        console.print()
+        renderables += [tools_table, ""]
 
     # Avoided Patterns
     if memory.preferences.avoided_patterns:
@@ -68,8 +72,7 @@ def show_memory():
             title="[yellow]Commands You Often Skip[/yellow]",
             border_style="yellow",
         )
-        console.print(avoided_panel)
-        console.print()
+        renderables += [avoided_panel, ""]
 
     # Common Sequences
     if memory.preferences.common_sequences:
@@ -80,8 +83,7 @@ def show_memory():
             workflow = " → ".join(sequence)
             seq_table.add_row(workflow)
 
-        console.print(seq_table)
-        console.print()
+        renderables += [seq_table, ""]
 
     # Current Context
     context_table = Table(title="Current Context", box=box.ROUNDED)
@@ -100,8 +102,7 @@ def show_memory():
         recent = ", ".join(memory.context.recent_queries[-3:])
         context_table.add_row("Recent Queries", recent)
 
-    console.print(context_table)
-    console.print()
+    renderables += [context_table, ""]
 
     # Learning Tips
     tips = memory.detect_learning_opportunities(history)
@@ -109,8 +110,7 @@ def show_memory():
         tips_panel = Panel(
             "\n\n".join(tips), title="[cyan]💡 Tips for You[/cyan]", border_style="cyan"
         )
-        console.print(tips_panel)
-        console.print()
+        renderables += [tips_panel, ""]
 
     # Success Rates
     success_rates = memory.analyze_command_success_rate(history)
@@ -120,31 +120,43 @@ def show_memory():
         success_table.add_column("Success Rate", justify="right")
         success_table.add_column("", justify="left")
 
-        for tool, rate in sorted(success_rates.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for tool, rate in heapq.nlargest(10, success_rates.items(), key=itemgetter(1)):
             percentage = f"{rate * 100:.0f}%"
             bar = "█" * int(rate * 10)
             success_table.add_row(tool, percentage, bar)
 
-        console.print(success_table)
-        console.print()
+        renderables += [success_table, ""]
+
+    console.print(Group(*renderables))
 
 
 @memory_app.command("stats")
 def show_stats():
     """Show statistics about your Drift usage."""
-    history_manager = HistoryManager()
+    from rich import box
+    from rich.table import Table
+
+    from drift_cli.core.history import get_history_manager
+
+    history_manager = get_history_manager()
     history = history_manager.get_history(limit=500)
 
     if not history:
         console.print("[yellow]No history found yet. Start using Drift![/yellow]")
         return
 
-    console.print("\n[bold cyan]📊 Drift Usage Statistics[/bold cyan]\n")
+    renderables = ["\n[bold cyan]📊 Drift Usage Statistics[/bold cyan]\n"]
 
-    # Overall stats
+    # Overall stats and risk distribution, gathered in one pass
     total_queries = len(history)
-    executed = sum(1 for entry in history if entry.executed)
-    successful = sum(1 for entry in history if entry.executed and entry.exit_code == 0)
+    executed = successful = 0
+    risk_counts = {"low": 0, "medium": 0, "high": 0}
+    for entry in history:
+        if entry.executed:
+            executed += 1
+            if entry.exit_code == 0:
+                successful += 1
+            risk_counts[entry.plan.risk.value] += 1
 
     stats_table = Table(title="Overall Usage", box=box.ROUNDED)
     stats_table.add_column("Metric", style="cyan")
@@ -162,29 +174,23 @@ def show_stats():
         success_rate = (successful / executed) * 100
         stats_table.add_row("Success Rate", f"{success_rate:.1f}%")
 
-    console.print(stats_table)
-    console.print()
+    renderables += [stats_table, ""]
 
     # Risk distribution
-    risk_counts = {"low": 0, "medium": 0, "high": 0}
-    for entry in history:
-        if entry.executed:
-            risk_counts[entry.plan.risk.value] += 1
-
-    if any(risk_counts.values()):
+    if executed:
         risk_table = Table(title="Risk Distribution (Executed)", box=box.ROUNDED)
         risk_table.add_column("Risk Level", style="cyan")
         risk_table.add_column("Count", justify="right")
         risk_table.add_column("Percentage", justify="right")
 
-        total_executed = sum(risk_counts.values())
         for risk_level, count in risk_counts.items():
             if count > 0:
-                pct = (count / total_executed) * 100
+                pct = (count / executed) * 100
                 risk_table.add_row(risk_level.upper(), str(count), f"{pct:.1f}%")
 
-        console.print(risk_table)
-        console.print()
+        renderables += [risk_table, ""]
+
+    console.print(Group(*renderables))
 
 
 @memory_app.command("reset")
@@ -201,7 +207,9 @@ def reset_memory(
             console.print("[cyan]Cancelled.[/cyan]")
             raise typer.Exit(0)
 
-    memory = MemoryManager()
+    from drift_cli.core.memory import get_memory_manager
+
+    memory = get_memory_manager()
     memory.reset()
 
     console.print("[green]✓ Memory reset successfully![/green]")
@@ -211,8 +219,13 @@ def reset_memory(
 @memory_app.command("insights")
 def show_insights():
     """Show personalized insights and suggestions."""
-    memory = MemoryManager()
-    history_manager = HistoryManager()
+    from rich.panel import Panel
+
+    from drift_cli.core.history import get_history_manager
+    from drift_cli.core.memory import get_memory_manager
+
+    memory = get_memory_manager()
+    history_manager = get_history_manager()
 
     history = history_manager.get_history(limit=100)
     if not history:
@@ -221,13 +234,12 @@ def show_insights():
 
     memory.learn_from_history(history)
 
-    console.print("\n[bold cyan]🔍 Personalized Insights[/bold cyan]\n")
+    renderables = ["\n[bold cyan]🔍 Personalized Insights[/bold cyan]\n"]
 
     # Context that will be sent to LLM
     context = memory.get_personalized_prompt_context()
     context_panel = Panel(context, title="[cyan]Context Sent to AI[/cyan]", border_style="cyan")
-    console.print(context_panel)
-    console.print()
+    renderables += [context_panel, ""]
 
     # Pattern-based suggestions
     suggestions = memory.suggest_based_on_patterns("general workflow")
@@ -237,8 +249,7 @@ def show_insights():
             title="[green]Smart Suggestions[/green]",
             border_style="green",
         )
-        console.print(sugg_panel)
-        console.print()
+        renderables += [sugg_panel, ""]
 
     # Tips
     tips = memory.detect_learning_opportunities(history)
@@ -248,62 +259,69 @@ def show_insights():
             title="[yellow]💡 Opportunities to Improve[/yellow]",
             border_style="yellow",
         )
-        console.print(tips_panel)
-        console.print()
+        renderables += [tips_panel, ""]
+
+    console.print(Group(*renderables))
 
 
 @memory_app.command("export")
 def export_memory(output: str = typer.Argument(..., help="Output file path (JSON format)")):
     """Export learned preferences to a file."""
-    import json
     from datetime import datetime
-    from pathlib import Path
 
-    memory = MemoryManager()
+    from drift_cli.core.jsonio import dumps_pretty
+    from drift_cli.core.memory import get_memory_manager
+
+    memory = get_memory_manager()
     output_path = Path(output).expanduser()
 
-    # Prepare export data
+    # UserPreference is a dataclass, so the serializer walks its fields directly
     export_data = {
         "version": "1.0",
         "exported_at": datetime.now().isoformat(),
         "current_project": memory.current_project,
-        "preferences": {
-            "comfortable_with_high_risk": memory.preferences.comfortable_with_high_risk,
-            "prefers_dry_run": memory.preferences.prefers_dry_run,
-            "prefers_verbose_explanations": memory.preferences.prefers_verbose_explanations,
-            "favorite_tools": list(memory.preferences.favorite_tools),  # Convert to list
-            "avoided_patterns": list(memory.preferences.avoided_patterns),
-            "common_sequences": [list(seq) for seq in memory.preferences.common_sequences],
-        },
+        "preferences": memory.preferences,
     }
 
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+        payload = dumps_pretty(export_data)
+        output_path.write_bytes(payload)
 
         console.print(f"[green]✓ Memory exported to: {output_path}[/green]")
         if memory.current_project:
             console.print(f"[cyan]Project: {memory.current_project}[/cyan]")
-        console.print(f"[cyan]File size: {output_path.stat().st_size} bytes[/cyan]")
+        console.print(f"[cyan]File size: {len(payload)} bytes[/cyan]")
     except Exception as e:
         console.print(f"[red]✗ Export failed: {e}[/red]")
         raise typer.Exit(1)
 
 
+def _load_project(path: Path) -> Optional[dict]:
+    """Parse one project memory file; unreadable files yield None."""
+    from drift_cli.core.jsonio import loads
+
+    try:
+        return loads(path.read_bytes())
+    except Exception:
+        return None
+
+
 @memory_app.command("projects")
 def list_projects():
     """List all projects with learned preferences."""
-    import json
+    from concurrent.futures import ThreadPoolExecutor
 
-    memory = MemoryManager()
-    projects_dir = memory.projects_dir
+    from rich import box
+    from rich.table import Table
 
-    if not projects_dir.exists():
-        console.print("[yellow]No project-specific memories found.[/yellow]")
-        return
+    from drift_cli.core.memory import get_memory_manager
 
-    project_files = list(projects_dir.glob("*.json"))
+    memory = get_memory_manager()
+    projects_dir = memory.projects_dir
+
+    # A missing directory just globs to nothing, so no separate exists() check
+    project_files = sorted(projects_dir.glob("*.json"))
 
     if not project_files:
         console.print("[yellow]No project-specific memories found.[/yellow]")
@@ -317,19 +335,19 @@ def list_projects():
     table.add_column("Tools", style="green")
     table.add_column("Patterns", style="magenta")
 
-    for project_file in sorted(project_files):
-        try:
-            with open(project_file) as f:
-                data = json.load(f)
+    # Reads overlap on worker threads; the table is filled here, in file order
+    with ThreadPoolExecutor(max_workers=min(8, len(project_files))) as pool:
+        loaded = list(pool.map(_load_project, project_files))
 
+    for project_file, data in zip(project_files, loaded):
+        if data is None:
+            continue
+        try:
             project_name = data.get("project", project_file.stem)
             last_updated = data.get("last_updated", "Unknown")
-            if last_updated != "Unknown":
-                # Format timestamp
-                from datetime import datetime
-
-                dt = datetime.fromisoformat(last_updated)
-                last_updated = dt.strftime("%Y-%m-%d %H:%M")
+            if len(last_updated) >= 16:
+                # Stored via isoformat(), so slicing yields "YYYY-MM-DD HH:MM"
+                last_updated = f"{last_updated[:10]} {last_updated[11:16]}"
 
             prefs = data.get("preferences", {})
             tools_count = len(prefs.get("favorite_tools", []))
@@ -354,10 +372,12 @@ def import_memory(
     ),
 ):
     """Import learned preferences from a file."""
-    import json
-    from pathlib import Path
+    from itertools import chain
 
-    memory = MemoryManager()
+    from drift_cli.core.jsonio import loads
+    from drift_cli.core.memory import get_memory_manager
+
+    memory = get_memory_manager()
     input_path = Path(input_file).expanduser()
 
     if not input_path.exists():
@@ -365,8 +385,7 @@ def import_memory(
         raise typer.Exit(1)
 
     try:
-        with open(input_path) as f:
-            import_data = json.load(f)
+        import_data = loads(input_path.read_bytes())
 
         # Validate version
         if import_data.get("version") != "1.0":
@@ -378,20 +397,27 @@ def import_memory(
             # Merge with existing preferences
             console.print("[cyan]Merging preferences...[/cyan]")
 
-            # Merge favorite tools (combine lists, keep unique)
-            existing_tools = set(memory.preferences.favorite_tools)
-            imported_tools = set(prefs_data["favorite_tools"])
-            memory.preferences.favorite_tools = list(existing_tools | imported_tools)
-
-            # Merge avoided patterns (union)
+            # Merge favorite tools and avoided patterns: existing first, then new
+            # imports, unique and in a stable order
+            memory.preferences.favorite_tools = list(
+                dict.fromkeys(
+                    chain(memory.preferences.favorite_tools, prefs_data["favorite_tools"])
+                )
+            )
             memory.preferences.avoided_patterns = list(
-                set(memory.preferences.avoided_patterns) | set(prefs_data["avoided_patterns"])
+                dict.fromkeys(
+                    chain(memory.preferences.avoided_patterns, prefs_data["avoided_patterns"])
+                )
             )
 
-            # Merge sequences (union)
-            existing_seqs = set(tuple(s) for s in memory.preferences.common_sequences)
-            imported_seqs = set(tuple(s) for s in prefs_data["common_sequences"])
-            memory.preferences.common_sequences = [list(s) for s in (existing_seqs | imported_seqs)]
+            # Merge sequences the same way, keyed on their tuple form
+            merged_seqs = dict.fromkeys(
+                tuple(seq)
+                for seq in chain(
+                    memory.preferences.common_sequences, prefs_data["common_sequences"]
+                )
+            )
+            memory.preferences.common_sequences = [list(seq) for seq in merged_seqs]
 
             # For boolean prefs, use OR logic (if either is true, keep true)
             memory.preferences.comfortable_with_high_risk = (
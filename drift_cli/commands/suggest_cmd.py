@@ -1,50 +1,74 @@
 """AI-powered suggestion, search, and explanation commands."""
 
+import atexit
 import os
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
 
-from drift_cli.core.auto_setup import (
-    ensure_ollama_ready,
-    schedule_idle_shutdown_if_needed,
-)
-from drift_cli.core.config import ConfigManager
-from drift_cli.core.executor import Executor
-from drift_cli.core.history import HistoryManager
-from drift_cli.core.memory import MemoryManager
-from drift_cli.core.ollama import OllamaClient
-from drift_cli.core.safety import SafetyChecker
-from drift_cli.core.slash_commands import SlashCommandHandler
-from drift_cli.ui.display import DriftUI
+from drift_cli.core.paths import CLEANUP_STAMP, SNAPSHOTS_DIR
+
+if TYPE_CHECKING:
+    from drift_cli.core.config import DriftConfig
+    from drift_cli.core.executor import Executor
+    from drift_cli.core.history import HistoryManager
+    from drift_cli.core.memory import MemoryManager
+    from drift_cli.core.ollama import OllamaClient
+    from drift_cli.core.response_cache import ResponseCache
+    from drift_cli.models import Plan
 
 console = Console()
 
 suggest_app = typer.Typer()
 
 
-def _get_config():
-    return ConfigManager()
+def _loaded_config() -> "DriftConfig":
+    from drift_cli.core.config import load_config
+
+    return load_config()
+
 
+@lru_cache(maxsize=1)
+def _get_ollama_client() -> "OllamaClient":
+    """Process-wide client, so every command reuses one keep-alive connection."""
+    from drift_cli.core.ollama import OllamaClient
 
-def _get_ollama_client() -> OllamaClient:
-    config = _get_config().load()
-    model = os.getenv("DRIFT_MODEL", config.model)
-    return OllamaClient(base_url=config.ollama_url, model=model)
+    config = _loaded_config()
+    client = OllamaClient(base_url=config.ollama_url, model=config.resolved_model)
+    atexit.register(client.close)
+    return client
 
 
 def _schedule_ollama_idle_shutdown() -> None:
-    config = _get_config().load()
+    from drift_cli.core.auto_setup import schedule_idle_shutdown_if_needed
+
+    config = _loaded_config()
     schedule_idle_shutdown_if_needed(
         enabled=config.auto_stop_ollama_when_idle,
         idle_minutes=config.ollama_idle_minutes,
     )
 
 
-def _check_ollama():
-    """Ensure Ollama is ready, using auto-setup config settings."""
-    config = _get_config().load()
-    model = os.getenv("DRIFT_MODEL", config.model)
+_ollama_verified = False
+
+
+def _check_ollama(force: bool = False):
+    """Ensure Ollama is ready, using auto-setup config settings.
+
+    A successful check is remembered for the rest of the process.
+    """
+    global _ollama_verified
+    if _ollama_verified and not force:
+        return
+
+    from drift_cli.core.auto_setup import ensure_ollama_ready
+
+    config = _loaded_config()
+    model = config.resolved_model
 
     ready = ensure_ollama_ready(
         model=model,
@@ -62,6 +86,119 @@ def _check_ollama():
         console.print(f"  3. Pull model     → ollama pull {model}")
         raise typer.Exit(1)
 
+    _ollama_verified = True
+
+
+_cleanup_done = False
+CLEANUP_CHECK_INTERVAL = 3600  # seconds between snapshot checks across runs
+
+
+def _auto_cleanup_snapshots(threshold: int = 100) -> None:
+    """Silently prune old snapshots once more than `threshold` have piled up.
+
+    Runs at most once per process, and a stamp file in ~/.drift spaces the
+    directory scans at least CLEANUP_CHECK_INTERVAL apart across processes.
+    """
+    global _cleanup_done
+    if _cleanup_done:
+        return
+    _cleanup_done = True
+
+    try:
+        # Fast path: a single stat of the stamp file
+        try:
+            if time.time() - os.stat(CLEANUP_STAMP).st_mtime < CLEANUP_CHECK_INTERVAL:
+                return
+        except FileNotFoundError:
+            pass
+
+        # A bare readdir is the only count: snapshots/ holds nothing but
+        # snapshot directories, and cleanup re-lists them from metadata anyway
+        if len(os.listdir(SNAPSHOTS_DIR)) > threshold:
+            from drift_cli.core.history import get_history_manager
+
+            get_history_manager().cleanup_old_snapshots(keep=50, max_age_days=30)
+
+        with open(CLEANUP_STAMP, "a"):
+            pass
+        os.utime(CLEANUP_STAMP)
+    except Exception:
+        pass
+
+
+@dataclass
+class SuggestDeps:
+    """Everything a suggest run needs, built once and shared by callers."""
+
+    config: "DriftConfig"
+    client: "OllamaClient"
+    executor: "Executor"
+    history: "HistoryManager"
+    use_memory: bool = True
+    use_cache: bool = False
+    _memory: Optional["MemoryManager"] = field(default=None, repr=False)
+    _cache: Optional["ResponseCache"] = field(default=None, repr=False)
+
+    @property
+    def memory(self) -> Optional["MemoryManager"]:
+        """Loaded on first use, so runs that fail the Ollama check never pay for it."""
+        if self.use_memory and self._memory is None:
+            from drift_cli.core.memory import get_memory_manager
+
+            self._memory = get_memory_manager()
+        return self._memory
+
+    @property
+    def cache(self) -> Optional["ResponseCache"]:
+        """Opened on first use, so slash errors and failed checks never touch cache.db."""
+        if self.use_cache and self._cache is None:
+            from drift_cli.core.response_cache import ResponseCache
+
+            self._cache = ResponseCache()
+        return self._cache
+
+    def close(self) -> None:
+        # The Ollama client is shared and closes itself at exit
+        if self._cache:
+            self._cache.close()
+
+
+def _build_deps(no_memory: bool = False, history: Optional["HistoryManager"] = None) -> SuggestDeps:
+    from drift_cli.core.executor import Executor
+    from drift_cli.core.history import get_history_manager
+
+    history = history or get_history_manager()
+    # --no-memory also means nothing is read from or written to the cache
+    return SuggestDeps(
+        config=_loaded_config(),
+        client=_get_ollama_client(),
+        executor=Executor(history_manager=history),
+        history=history,
+        use_memory=not no_memory,
+        use_cache=not no_memory,
+    )
+
+
+def _plan_uses_answers(plan: "Plan", resolved: dict) -> bool:
+    """Whether the tool behind every resolved answer appears in the plan's commands."""
+    words = {word for cmd in plan.commands for word in cmd.command.lower().split()}
+    return all(tool in words for _, tool in resolved.values())
+
+
+def _show_local_help(query: str) -> bool:
+    """Answer /help locally; returns True if the query was handled."""
+    # Allocation-free rejects first; most queries have no slash at all
+    if len(query) < 5 or "/" not in query:
+        return False
+    stripped = query.strip()
+    if len(stripped) != 5 or stripped.lower() != "/help":
+        return False
+
+    from drift_cli.core.slash_commands import SlashCommandHandler
+
+    console.print(SlashCommandHandler().get_help_text())
+    return True
+
 
 @suggest_app.command("suggest")
 def suggest(
@@ -76,68 +213,115 @@ def suggest(
     ),
 ):
     """Get AI-powered command suggestions from natural language."""
-    from pathlib import Path
+    # /help is purely local — answer it before any setup work
+    if _show_local_help(query):
+        return
 
-    # Auto-cleanup old snapshots silently
+    deps = _build_deps(no_memory=no_memory)
     try:
-        snapshots_dir = Path.home() / ".drift" / "snapshots"
-        if snapshots_dir.exists():
-            count = sum(1 for d in snapshots_dir.iterdir() if d.is_dir())
-            if count > 100:
-                HistoryManager().cleanup_old_snapshots(keep=50, max_age_days=30)
-    except Exception:
-        pass
-
-    memory = None if no_memory else MemoryManager()
-    if memory:
-        memory.update_context(query=query)
-
-    # Handle slash commands
-    slash_handler = SlashCommandHandler(memory=memory)
-    is_slash, enhanced_query, error = slash_handler.process_slash_command(query)
-
+        _run_suggest(query, deps, execute=execute, dry_run=dry_run, verbose=verbose)
+    finally:
+        deps.close()
+
+
+def _run_suggest(
+    query: str,
+    deps: SuggestDeps,
+    execute: bool = False,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> None:
+    """Plan, review and optionally run `query` using prebuilt dependencies."""
+    from pydantic import ValidationError
+
+    from drift_cli.core.safety import SafetyChecker
+    from drift_cli.core.slash_commands import SlashCommandHandler
+    from drift_cli.models import Plan, RiskLevel
+    from drift_cli.ui.display import DriftUI
+    from drift_cli.ui.progress import ProgressSpinner
+
+    client, executor, history = deps.client, deps.executor, deps.history
+
+    # Slash commands are validated locally, before any Ollama work; they are
+    # also the only queries that need memory this early.
+    slash_handler = SlashCommandHandler()
+    is_slash = slash_handler.is_slash_command(query)
     if is_slash:
-        if query.strip().lower() == "/help":
-            console.print(slash_handler.get_help_text())
-            return
+        memory = deps.memory
+        if memory:
+            memory.update_context(query=query)
+            slash_handler = SlashCommandHandler(memory=memory)
+        _, enhanced_query, error = slash_handler.process_slash_command(query)
         if error:
             DriftUI.show_error(error)
             raise typer.Exit(1)
         query = enhanced_query
 
+    _auto_cleanup_snapshots()
     _check_ollama()
 
-    client = _get_ollama_client()
-    executor = Executor()
-    history = HistoryManager()
+    memory = deps.memory
+    if memory and not is_slash:
+        memory.update_context(query=query)
 
     try:
+        # Prompt layout: [static system + context] [memory pack] | [dynamic tail]
+        # Memory is folded in here, so get_plan is told not to add its own pass;
+        # the clarification call then differs from the first only in its tail.
         context = executor.get_context()
+        activity = ""
 
         if memory:
             context = memory.enhance_prompt_with_context(context)
-
-        from drift_cli.ui.progress import ProgressSpinner
+            # The current query was already recorded above; leave it out so
+            # repeating a query yields the same activity (and cache key)
+            activity = memory.get_recent_activity(exclude=query)
 
         with ProgressSpinner("Thinking..."):
-            plan = client.get_plan(query, context)
+            cache = deps.cache
+            key = cached = None
+            if cache:
+                # Keyed on everything the prompt contains, recent activity included
+                key = cache.make_key(client.model, context, activity, query)
+                cached = cache.get(key)
+            plan = None
+            if cached is not None:
+                try:
+                    plan = Plan.model_validate_json(cached)
+                except ValidationError:
+                    pass  # stale or corrupt entry: ask the model again
+            if plan is None:
+                plan = client.get_plan(query, context, extra_context=activity, use_memory=False)
+                # Only low-risk plans are replayed; anything riskier is asked afresh
+                if cache and plan.risk == RiskLevel.LOW:
+                    cache.set(key, plan.model_dump_json())
 
         # Handle clarification
+        resolved = None
+        if plan.clarification_needed and memory:
+            resolved = memory.resolve_clarifications(plan.clarification_needed)
+            if resolved and plan.commands and _plan_uses_answers(plan, resolved):
+                # The best-guess plan already assumed what memory picked
+                plan = plan.model_copy(update={"clarification_needed": None})
+
         if plan.clarification_needed:
-            answers = DriftUI.ask_clarification(plan.clarification_needed)
-            clarification_context = f"{context}\n\nClarifications:\n"
+            if resolved:
+                answers = {idx: option for idx, (option, _) in resolved.items()}
+            else:
+                answers = DriftUI.ask_clarification(plan.clarification_needed)
+            clarifications = f"{activity}\n\nClarifications:\n" if activity else "Clarifications:\n"
             for idx, answer in answers.items():
-                clarification_context += (
-                    f"Q: {plan.clarification_needed[idx].question}\nA: {answer}\n"
-                )
+                clarifications += f"Q: {plan.clarification_needed[idx].question}\nA: {answer}\n"
+            # Same context as the first call, so Ollama reuses the cached prefix
             with ProgressSpinner("Re-analyzing..."):
-                plan = client.get_plan(query, clarification_context)
+                plan = client.get_plan(
+                    query, context, extra_context=clarifications, use_memory=False
+                )
 
         DriftUI.show_plan(plan, query, show_explanation=verbose)
 
         # Safety check
-        commands_list = [cmd.command for cmd in plan.commands]
-        all_safe, warnings = SafetyChecker.validate_commands(commands_list)
+        all_safe, warnings = SafetyChecker.validate_commands(cmd.command for cmd in plan.commands)
 
         if warnings:
             for warning in warnings:
@@ -145,7 +329,7 @@ def suggest(
 
         if not all_safe:
             DriftUI.show_error("Commands blocked for safety. Aborting.")
-            history.add_entry(query, plan, executed=False)
+            history.queue_entry(query, plan, executed=False)
             raise typer.Exit(1)
 
         # Execute or confirm
@@ -154,7 +338,7 @@ def suggest(
             exit_code, output, _ = executor.execute_plan(plan, dry_run=True)
             if output:
                 console.print(output)
-            history.add_entry(query, plan, executed=False)
+            history.queue_entry(query, plan, executed=False)
             if memory:
                 memory.learn_from_execution(plan, executed=False, success=False)
 
@@ -162,7 +346,7 @@ def suggest(
             exit_code, output, snapshot_id = executor.execute_plan(plan, dry_run=False)
             console.print()
             DriftUI.show_execution_result(exit_code, output)
-            history.add_entry(
+            history.queue_entry(
                 query, plan, executed=True, exit_code=exit_code, snapshot_id=snapshot_id
             )
             if memory:
@@ -171,7 +355,7 @@ def suggest(
                 console.print(f"[dim]Snapshot: {snapshot_id[:8]}… (drift undo to rollback)[/dim]")
         else:
             DriftUI.show_info("Cancelled")
-            history.add_entry(query, plan, executed=False)
+            history.queue_entry(query, plan, executed=False)
             if memory:
                 memory.learn_from_execution(plan, executed=False, success=False)
 
@@ -180,31 +364,48 @@ def suggest(
         raise typer.Exit(1)
     finally:
         _schedule_ollama_idle_shutdown()
-        client.close()
+
+
+_FIND_PREFIX = "Find: "
+_FIND_SUFFIX = (
+    ". Use safe read-only commands like 'find', 'rg', 'grep', 'fd', or 'ls'. "
+    "Do not modify any files."
+)
 
 
 @suggest_app.command("find")
 def find(query: str = typer.Argument(..., help="What to find")):
     """Smart file and content search."""
-    find_query = (
-        f"Find: {query}. Use safe read-only commands like 'find', 'rg', 'grep', "
-        "'fd', or 'ls'. Do not modify any files."
-    )
-    suggest(query=find_query, execute=False, dry_run=False, verbose=False)
+    find_query = _FIND_PREFIX + query + _FIND_SUFFIX
+    # Searches are read-only and synthetic, so personalization adds nothing
+    deps = _build_deps(no_memory=True)
+    try:
+        _run_suggest(find_query, deps)
+    finally:
+        deps.close()
 
 
 @suggest_app.command("explain")
 def explain(command: str = typer.Argument(..., help="Command to explain")):
     """Explain what a shell command does."""
-    _check_ollama()
-    client = _get_ollama_client()
+    from drift_cli.core.response_cache import ResponseCache
+    from drift_cli.ui.display import DriftUI
+
+    cache = ResponseCache()
+    key = cache.make_key(_loaded_config().resolved_model, "explain", command)
     try:
-        explanation = client.explain_command(command)
+        explanation = cache.get(key)
+        if explanation is None:
+            _check_ollama()
+            try:
+                explanation = _get_ollama_client().explain_command(command)
+            finally:
+                _schedule_ollama_idle_shutdown()
+            cache.set(key, explanation)
         console.print()
         console.print(explanation)
     except ValueError as e:
         DriftUI.show_error(str(e))
         raise typer.Exit(1)
     finally:
-        _schedule_ollama_idle_shutdown()
-        client.close()
+        cache.close()
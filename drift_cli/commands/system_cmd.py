@@ -2,65 +2,120 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
-from drift_cli.core.config import ConfigManager, DriftConfig
-from drift_cli.core.first_run import run_setup_wizard
-from drift_cli.ui.display import DriftUI
+from drift_cli.core.paths import DRIFT_DIR, HOME, SNAPSHOTS_DIR, ZSHRC
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from drift_cli.core.config import ConfigManager, DriftConfig
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Rich console, built on first use so `drift version` never imports Rich."""
+    from rich.console import Console
+
+    return Console()
 
-console = Console()
 
 system_app = typer.Typer()
 
+# Matches the point where suggest starts pruning snapshots on its own
+SNAPSHOT_WARN_THRESHOLD = 100
+
+_ON, _OFF = "[green]ON[/green]", "[red]OFF[/red]"
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> "ConfigManager":
+    from drift_cli.core.config import ConfigManager
 
-def _get_config() -> ConfigManager:
     return ConfigManager()
 
 
+def _loaded_config() -> "DriftConfig":
+    from drift_cli.core.config import load_config
+
+    return load_config()
+
+
+def _zshrc_sources_drift(zshrc: str) -> bool:
+    """Stream ~/.zshrc as bytes and stop at the first line mentioning drift.zsh."""
+    try:
+        with open(zshrc, "rb") as f:
+            return any(b"drift.zsh" in line for line in f)
+    except OSError:
+        return False
+
+
 @system_app.command("doctor")
 def doctor():
     """Diagnose and fix common issues."""
+    from concurrent.futures import ThreadPoolExecutor
+
     from drift_cli.core.auto_setup import (
         install_ollama,
         is_model_available,
         is_ollama_installed,
-        is_ollama_running,
+        probe_ollama,
         pull_model,
         start_ollama,
     )
+    from drift_cli.core.history import count_snapshots
+    from drift_cli.ui.display import DriftUI
 
-    console.print("[bold cyan]Drift Doctor[/bold cyan]\n")
+    _console().print("[bold cyan]Drift Doctor[/bold cyan]\n")
 
-    config = _get_config().load()
-    model = os.getenv("DRIFT_MODEL", config.model)
+    config = _loaded_config()
+    model = config.resolved_model
     ok = True
 
+    # One round of probes; a single /api/tags call answers server and model.
+    # It is network-bound, so the read-only local scans run while it is in flight.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        probe = pool.submit(probe_ollama, model, config.ollama_url)
+        # Snapshots: a streamed count, stopping once cleanup is clearly due
+        snapshot_count = count_snapshots(SNAPSHOTS_DIR, stop_after=SNAPSHOT_WARN_THRESHOLD)
+        zsh_integrated = _zshrc_sources_drift(ZSHRC) if os.path.isfile(ZSHRC) else None
+        status = probe.result()
+    installed, running, model_ready = status.installed, status.running, status.model_ready
+
+    # Fixes below mutate system state, so they stay on the main thread.
+
     # Ollama binary
-    if is_ollama_installed():
+    if installed:
         DriftUI.show_success("Ollama installed")
     elif config.auto_install_ollama:
         ok = install_ollama() or False
+        installed = ok and is_ollama_installed()
     else:
         ok = False
         DriftUI.show_error("Ollama not installed → https://ollama.com")
 
     # Ollama server
-    if is_ollama_installed():
-        if is_ollama_running(config.ollama_url):
+    running = installed and running
+    if installed:
+        if running:
             DriftUI.show_success("Ollama running")
         elif config.auto_start_ollama:
-            if not start_ollama(config.ollama_url):
+            running = start_ollama(config.ollama_url)
+            if not running:
                 ok = False
+            else:
+                model_ready = is_model_available(model, config.ollama_url)
         else:
             ok = False
             DriftUI.show_warning("Ollama not running → ollama serve")
 
     # Model
-    if is_ollama_installed() and is_ollama_running(config.ollama_url):
-        if is_model_available(model, config.ollama_url):
+    if running:
+        if model_ready:
             DriftUI.show_success(f"Model {model} ready")
         elif config.auto_pull_model:
             if not pull_model(model, config.ollama_url):
@@ -70,17 +125,28 @@ def doctor():
             DriftUI.show_warning(f"Model {model} missing → ollama pull {model}")
 
     # Drift directory
-    drift_dir = Path.home() / ".drift"
-    if drift_dir.exists():
-        DriftUI.show_success(f"Config: {drift_dir}")
+    if os.path.isdir(DRIFT_DIR):
+        DriftUI.show_success(f"Config: {DRIFT_DIR}")
     else:
         DriftUI.show_warning("No ~/.drift directory")
 
-    console.print()
+    # Snapshots
+    if snapshot_count > SNAPSHOT_WARN_THRESHOLD:
+        DriftUI.show_warning(f"Over {SNAPSHOT_WARN_THRESHOLD} snapshots → drift cleanup")
+    elif snapshot_count:
+        DriftUI.show_success(f"Snapshots: {snapshot_count}")
+
+    # ZSH integration (optional, so never fails the run)
+    if zsh_integrated is not None:
+        if zsh_integrated:
+            DriftUI.show_success("ZSH integration")
+        else:
+            DriftUI.show_warning("ZSH integration not set up → source ~/.drift/drift.zsh")
+
     if ok:
-        console.print("[bold green]All checks passed[/bold green]")
+        _console().print("\n[bold green]All checks passed[/bold green]")
     else:
-        console.print("[yellow]Some issues remain — see above[/yellow]")
+        _console().print("\n[yellow]Some issues remain — see above[/yellow]")
 
 
 @system_app.command("config")
@@ -88,29 +154,31 @@ def config():
     """View and change Drift settings interactively."""
     from rich.prompt import Confirm, Prompt
 
+    from drift_cli.core.config import DriftConfig
+    from drift_cli.ui.display import DriftUI
+
     cm = _get_config()
-    cfg = cm.load()
-
-    console.print("[bold cyan]Drift Settings[/bold cyan]\n")
-    console.print(f"  [cyan]model[/cyan]          = {cfg.model}")
-    console.print(f"  [cyan]ollama_url[/cyan]     = {cfg.ollama_url}")
-    console.print(f"  [cyan]temperature[/cyan]    = {cfg.temperature}")
-    console.print(f"  [cyan]max_history[/cyan]    = {cfg.max_history}")
-    console.print(f"  [cyan]auto_install[/cyan]   = {'ON' if cfg.auto_install_ollama else 'OFF'}")
-    console.print(f"  [cyan]auto_start[/cyan]     = {'ON' if cfg.auto_start_ollama else 'OFF'}")
-    console.print(f"  [cyan]auto_pull[/cyan]      = {'ON' if cfg.auto_pull_model else 'OFF'}")
-    console.print(f"  [cyan]auto_snapshot[/cyan]  = {'ON' if cfg.auto_snapshot else 'OFF'}")
-    console.print(
-        "  [cyan]auto_stop_idle[/cyan] = "
-        f"{'ON' if cfg.auto_stop_ollama_when_idle else 'OFF'}"
+    cfg = _loaded_config()
+
+    _console().print("[bold cyan]Drift Settings[/bold cyan]\n")
+    # One print, so Rich parses the settings markup in a single pass
+    _console().print(
+        f"  [cyan]model[/cyan]          = {cfg.model}\n"
+        f"  [cyan]ollama_url[/cyan]     = {cfg.ollama_url}\n"
+        f"  [cyan]temperature[/cyan]    = {cfg.temperature}\n"
+        f"  [cyan]max_history[/cyan]    = {cfg.max_history}\n"
+        f"  [cyan]auto_install[/cyan]   = {_ON if cfg.auto_install_ollama else _OFF}\n"
+        f"  [cyan]auto_start[/cyan]     = {_ON if cfg.auto_start_ollama else _OFF}\n"
+        f"  [cyan]auto_pull[/cyan]      = {_ON if cfg.auto_pull_model else _OFF}\n"
+        f"  [cyan]auto_snapshot[/cyan]  = {_ON if cfg.auto_snapshot else _OFF}\n"
+        f"  [cyan]auto_stop_idle[/cyan] = {_ON if cfg.auto_stop_ollama_when_idle else _OFF}\n"
+        f"  [cyan]idle_minutes[/cyan]   = {cfg.ollama_idle_minutes}\n"
     )
-    console.print(f"  [cyan]idle_minutes[/cyan]   = {cfg.ollama_idle_minutes}")
-    console.print()
 
     if not Confirm.ask("Edit settings?", default=False):
         return
 
-    console.print("[dim]Press Enter to keep current value[/dim]\n")
+    _console().print("[dim]Press Enter to keep current value[/dim]\n")
 
     new_model = Prompt.ask("Model", default=cfg.model)
     new_url = Prompt.ask("Ollama URL", default=cfg.ollama_url)
@@ -150,11 +218,52 @@ def config():
 @system_app.command("setup")
 def setup():
     """Re-run the first-time setup wizard."""
+    from drift_cli.core.first_run import run_setup_wizard
+
     run_setup_wizard()
 
 
+# Files whose changes mean the editable install must be refreshed
+_PACKAGING_FILES = ("pyproject.toml", "setup.py", "setup.cfg", "requirements*.txt")
+
+
+def _install_matches_pyproject(repo_dir: Path) -> bool:
+    """Whether the installed metadata already has pyproject's version, scripts and requirements.
+
+    An editable install runs the pulled sources directly, so pip is only needed
+    when one of these changed. Without tomllib (Python < 3.11) assume it did.
+    """
+    from importlib.metadata import distribution
+
+    try:
+        import tomllib
+    except ImportError:
+        return False
+
+    try:
+        with open(repo_dir / "pyproject.toml", "rb") as f:
+            project = tomllib.load(f)["project"]
+        dist = distribution("drift-cli")
+    except Exception:
+        return False
+
+    scripts = {ep.name: ep.value for ep in dist.entry_points if ep.group == "console_scripts"}
+    requires = set(project.get("dependencies", []))
+    for extra, reqs in project.get("optional-dependencies", {}).items():
+        requires.update(f'{req}; extra == "{extra}"' for req in reqs)
+    return (
+        dist.version == project.get("version")
+        and scripts == project.get("scripts", {})
+        and set(dist.requires or ()) == requires
+    )
+
+
 @system_app.command("update")
-def update():
+def update(
+    force_reinstall: bool = typer.Option(
+        False, "--force-reinstall", help="Re-run pip install even if packaging is unchanged"
+    ),
+):
     """Update Drift CLI to the latest version."""
     import subprocess
 
@@ -162,14 +271,16 @@ def update():
 
     git_dir = repo_dir / ".git"
     if not git_dir.exists():
-        console.print("[red]✗ Cannot auto-update: Drift was not installed from a git clone.[/red]")
-        console.print(
+        _console().print(
+            "[red]✗ Cannot auto-update: Drift was not installed from a git clone.[/red]"
+        )
+        _console().print(
             "  [dim]Reinstall with:[/dim]  git clone "
             "https://github.com/a-elhaag/drift-cli.git && cd drift-cli && pip install -e ."
         )
         raise typer.Exit(1)
 
-    console.print("[cyan]🔄 Checking for updates...[/cyan]")
+    _console().print("[cyan]🔄 Checking for updates...[/cyan]")
 
     try:
         fetch_result = subprocess.run(
@@ -180,10 +291,10 @@ def update():
             timeout=30,
         )
         if fetch_result.returncode != 0:
-            console.print("[red]✗ Failed to fetch latest updates from remote.[/red]")
+            _console().print("[red]✗ Failed to fetch latest updates from remote.[/red]")
             details = fetch_result.stderr.strip() or fetch_result.stdout.strip()
             if details:
-                console.print(f"  [dim]{details}[/dim]")
+                _console().print(f"  [dim]{details}[/dim]")
             raise typer.Exit(1)
 
         behind = subprocess.run(
@@ -195,11 +306,11 @@ def update():
         )
 
         if behind.returncode != 0:
-            console.print("[red]✗ Cannot determine upstream status for this branch.[/red]")
+            _console().print("[red]✗ Cannot determine upstream status for this branch.[/red]")
             details = behind.stderr.strip() or behind.stdout.strip()
             if details:
-                console.print(f"  [dim]{details}[/dim]")
-            console.print(
+                _console().print(f"  [dim]{details}[/dim]")
+            _console().print(
                 "[dim]Set upstream, then retry: git branch --set-upstream-to origin/main[/dim]"
             )
             raise typer.Exit(1)
@@ -207,17 +318,17 @@ def update():
         try:
             commits_behind = int(behind.stdout.strip() or "0")
         except ValueError:
-            console.print("[red]✗ Unexpected git output while checking updates.[/red]")
+            _console().print("[red]✗ Unexpected git output while checking updates.[/red]")
             details = behind.stdout.strip() or behind.stderr.strip()
             if details:
-                console.print(f"  [dim]{details}[/dim]")
+                _console().print(f"  [dim]{details}[/dim]")
             raise typer.Exit(1)
 
         if commits_behind == 0:
-            console.print("[green]✓ Drift CLI is already up to date.[/green]")
+            _console().print("[green]✓ Drift CLI is already up to date.[/green]")
             return
 
-        console.print(
+        _console().print(
             f"[yellow]  {commits_behind} new commit"
             f"{'s' if commits_behind != 1 else ''} available[/yellow]"
         )
@@ -231,10 +342,27 @@ def update():
         )
 
         if result.returncode != 0:
-            console.print("[red]✗ Update failed (merge conflict or diverged branch).[/red]")
-            console.print(f"  [dim]{result.stderr.strip()}[/dim]")
+            _console().print("[red]✗ Update failed (merge conflict or diverged branch).[/red]")
+            _console().print(f"  [dim]{result.stderr.strip()}[/dim]")
             raise typer.Exit(1)
 
+        # An editable install already runs the pulled sources; pip only matters
+        # when packaging changed (ORIG_HEAD is where the pull started from) in a
+        # way the installed metadata does not already reflect.
+        if not force_reinstall:
+            packaging = subprocess.run(
+                ["git", "diff", "--quiet", "ORIG_HEAD", "HEAD", "--", *_PACKAGING_FILES],
+                cwd=repo_dir,
+                capture_output=True,
+                timeout=10,
+            )
+            if packaging.returncode == 0 or _install_matches_pyproject(repo_dir):
+                _console().print(
+                    f"[green]✓ Pulled {commits_behind} commit"
+                    f"{'s' if commits_behind != 1 else ''} (no reinstall needed)[/green]"
+                )
+                return
+
         pip_result = subprocess.run(
             [sys.executable, "-m", "pip", "install", "-e", ".", "--quiet"],
             cwd=repo_dir,
@@ -244,48 +372,74 @@ def update():
         )
 
         if pip_result.returncode != 0:
-            console.print("[yellow]⚠ Code updated but pip install had issues:[/yellow]")
-            console.print(f"  [dim]{pip_result.stderr.strip()}[/dim]")
+            _console().print("[yellow]⚠ Code updated but pip install had issues:[/yellow]")
+            _console().print(f"  [dim]{pip_result.stderr.strip()}[/dim]")
         else:
             from drift_cli import __version__
 
-            console.print(f"[green]✓ Updated to Drift CLI v{__version__}[/green]")
+            _console().print(f"[green]✓ Updated to Drift CLI v{__version__}[/green]")
 
     except subprocess.TimeoutExpired:
-        console.print("[red]✗ Update timed out. Check your network connection.[/red]")
+        _console().print("[red]✗ Update timed out. Check your network connection.[/red]")
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]✗ Update failed: {e}[/red]")
+        _console().print(f"[red]✗ Update failed: {e}[/red]")
         raise typer.Exit(1)
 
 
+def _remove_tree_in_background(path: str) -> None:
+    """Move a directory aside at once and let a detached `rm -rf` delete it.
+
+    Falls back to deleting in-process where the rename or `rm` is unavailable.
+    """
+    import shutil
+    import subprocess
+
+    doomed = f"{path}.uninstall-{os.getpid()}"
+    try:
+        os.rename(path, doomed)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    try:
+        subprocess.Popen(
+            ["rm", "-rf", doomed],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        shutil.rmtree(doomed, ignore_errors=True)
+
+
 @system_app.command("uninstall")
 def uninstall():
     """Uninstall Drift CLI and clean up all data."""
-    import shutil
     import subprocess
 
-    console.print("[bold red]Drift Uninstaller[/bold red]\n")
-    console.print("This will remove:")
-    console.print("  1. drift-cli Python package")
-    console.print("  2. ~/.drift directory (config, history, snapshots)")
-    console.print()
+    from drift_cli.ui.display import DriftUI
+
+    _console().print(
+        "[bold red]Drift Uninstaller[/bold red]\n\n"
+        "This will remove:\n"
+        "  1. drift-cli Python package\n"
+        "  2. ~/.drift directory (config, history, snapshots)\n"
+    )
 
     if not typer.confirm("Proceed with uninstall?", default=False):
         DriftUI.show_info("Cancelled")
         return
 
-    drift_dir = Path.home() / ".drift"
-    if drift_dir.exists():
-        shutil.rmtree(drift_dir)
+    if os.path.isdir(DRIFT_DIR):
+        _remove_tree_in_background(DRIFT_DIR)
         DriftUI.show_success("Removed ~/.drift")
     else:
-        console.print("[dim]  ~/.drift not found (skipped)[/dim]")
+        _console().print("[dim]  ~/.drift not found (skipped)[/dim]")
 
     from drift_cli.core.auto_setup import is_ollama_installed
 
     if is_ollama_installed():
-        console.print()
+        _console().print()
         if typer.confirm("Also uninstall Ollama?", default=False):
             import platform
 
@@ -296,12 +450,12 @@ def uninstall():
                     subprocess.run(["pkill", "-f", "Ollama"], capture_output=True)
                     app_path = Path("/Applications/Ollama.app")
                     if app_path.exists():
-                        shutil.rmtree(app_path)
-                    for p in ["/usr/local/bin/ollama", str(Path.home() / ".ollama")]:
+                        _remove_tree_in_background(str(app_path))
+                    for p in ["/usr/local/bin/ollama", os.path.join(HOME, ".ollama")]:
                         path = Path(p)
                         if path.exists():
                             if path.is_dir():
-                                shutil.rmtree(path)
+                                _remove_tree_in_background(p)
                             else:
                                 path.unlink()
                     DriftUI.show_success("Ollama removed")
@@ -310,19 +464,18 @@ def uninstall():
                         ["sudo", "rm", "-f", "/usr/local/bin/ollama"],
                         capture_output=True,
                     )
-                    shutil.rmtree(Path.home() / ".ollama", ignore_errors=True)
+                    models_dir = os.path.join(HOME, ".ollama")
+                    if os.path.isdir(models_dir):
+                        _remove_tree_in_background(models_dir)
                     DriftUI.show_success("Ollama removed")
                 else:
                     DriftUI.show_warning(f"Manual Ollama removal needed on {system}")
             except Exception as e:
                 DriftUI.show_warning(f"Ollama removal incomplete: {e}")
         else:
-            console.print("[dim]  Ollama kept[/dim]")
+            _console().print("[dim]  Ollama kept[/dim]")
 
-    console.print()
-    console.print("[yellow]To finish, run:[/yellow]")
-    console.print("  [cyan]pip uninstall drift-cli[/cyan]")
-    console.print()
+    _console().print("\n[yellow]To finish, run:[/yellow]\n  [cyan]pip uninstall drift-cli[/cyan]\n")
 
 
 @system_app.command("version")
@@ -330,4 +483,4 @@ def version():
     """Show Drift CLI version."""
     from drift_cli import __version__
 
-    console.print(f"Drift CLI v{__version__}")
+    typer.echo(f"Drift CLI v{__version__}")
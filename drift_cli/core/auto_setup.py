@@ -1,12 +1,16 @@
 """Auto-setup utilities for Ollama installation, model pulling, and server management."""
 
+import atexit
 import os
 import platform
 import shutil
 import subprocess
 import sys
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 import httpx
 from rich.console import Console
@@ -14,6 +18,44 @@ from rich.console import Console
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _probe_client() -> httpx.Client:
+    """Keep-alive client shared by every health probe; closed at exit."""
+    client = httpx.Client(timeout=5.0)
+    atexit.register(client.close)
+    return client
+
+
+# Successful /api/tags answers per base URL, as (time.monotonic(), payload)
+_TAGS_TTL = 2.0
+_tags_cache: Dict[str, Tuple[float, dict]] = {}
+
+
+def _get_tags(base_url: str, ttl: float = _TAGS_TTL) -> Optional[dict]:
+    """GET /api/tags, reusing a successful answer for ttl seconds.
+
+    Returns None when the server is unreachable. Failures are never cached,
+    so polling for a server that is still starting keeps asking.
+    """
+    hit = _tags_cache.get(base_url)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    try:
+        resp = _probe_client().get(f"{base_url}/api/tags")
+    except Exception:
+        return None
+    if resp.status_code != 200:
+        return None
+    try:
+        tags = resp.json()
+    except ValueError:
+        tags = None
+    if not isinstance(tags, dict):
+        tags = {}
+    _tags_cache[base_url] = (time.monotonic(), tags)
+    return tags
+
+
 def _drift_dir() -> Path:
     return Path.home() / ".drift"
 
@@ -105,44 +147,69 @@ def schedule_idle_shutdown_if_needed(
     )
 
 
+_OLLAMA_APP = "/Applications/Ollama.app"
+
+
+@lru_cache(maxsize=1)
+def _ollama_path() -> Optional[str]:
+    """Resolved ollama binary; cleared by install_ollama, which can change it."""
+    return shutil.which("ollama")
+
+
+def _has_ollama_app() -> bool:
+    """Whether the macOS app bundle is present."""
+    return os.path.isdir(_OLLAMA_APP)
+
+
 def is_ollama_installed() -> bool:
     """Check if the Ollama binary is available on the system."""
-    return shutil.which("ollama") is not None
+    return _ollama_path() is not None
 
 
 def is_ollama_running(base_url: str = "http://localhost:11434") -> bool:
     """Check if the Ollama server is running and reachable."""
-    try:
-        resp = httpx.get(f"{base_url}/api/tags", timeout=5.0)
-        return resp.status_code == 200
-    except Exception:
-        return False
+    return _get_tags(base_url) is not None
+
+
+def _model_listed(model: str, tags: dict) -> bool:
+    """Whether the /api/tags payload lists the model.
+
+    A tagged request ("qwen2.5-coder:1.5b") needs that exact tag; a bare one
+    ("qwen2.5-coder") is satisfied by any tag of the same model.
+    """
+    names = {m.get("name", "") for m in tags.get("models", [])}
+    if model in names:
+        return True
+    base, _, tag = model.partition(":")
+    return not tag and any(name.partition(":")[0] == base for name in names)
 
 
 def is_model_available(model: str, base_url: str = "http://localhost:11434") -> bool:
     """Check if a specific model is pulled and available locally."""
-    try:
-        resp = httpx.get(f"{base_url}/api/tags", timeout=5.0)
-        if resp.status_code != 200:
-            return False
-        data = resp.json()
-        available = [m.get("name", "") for m in data.get("models", [])]
-        # Match both "model:tag" and just "model" (Ollama sometimes includes :latest)
-        for name in available:
-            if (
-                name == model
-                or name.startswith(f"{model}:")
-                or model.startswith(f"{name.split(':')[0]}")
-            ):
-                return True
-            # Also check without tag
-            if ":" in model:
-                base, tag = model.rsplit(":", 1)
-                if name == model or name == f"{base}:{tag}":
-                    return True
-        return False
-    except Exception:
-        return False
+    tags = _get_tags(base_url)
+    return tags is not None and _model_listed(model, tags)
+
+
+@dataclass
+class OllamaStatus:
+    """Snapshot of Ollama readiness from a single round of probes."""
+
+    installed: bool
+    running: bool
+    model_ready: bool
+
+
+def probe_ollama(model: str, base_url: str = "http://localhost:11434") -> OllamaStatus:
+    """Check install, server and model at once; one /api/tags call answers both of the latter.
+
+    A server that answers is usable whether or not the binary is on PATH (it
+    may be remote), so the PATH lookup only happens when the probe fails.
+    """
+    tags = _get_tags(base_url)
+    running = tags is not None
+    model_ready = running and _model_listed(model, tags)
+    installed = running or is_ollama_installed()
+    return OllamaStatus(installed=installed, running=running, model_ready=model_ready)
 
 
 def install_ollama() -> bool:
@@ -196,12 +263,7 @@ def install_ollama() -> bool:
                     text=True,
                     timeout=60,
                 )
-                if shutil.which("ollama") or (
-                    subprocess.run(
-                        ["test", "-d", "/Applications/Ollama.app"], capture_output=True
-                    ).returncode
-                    == 0
-                ):
+                if shutil.which("ollama") or _has_ollama_app():
                     console.print("[green]  ✓ Ollama installed[/green]")
                     return True
 
@@ -240,6 +302,8 @@ def install_ollama() -> bool:
     except Exception as e:
         console.print(f"[yellow]  ⚠ Installation failed: {e}[/yellow]")
         return False
+    finally:
+        _ollama_path.cache_clear()
 
 
 def start_ollama(base_url: str = "http://localhost:11434", timeout: int = 15) -> bool:
@@ -262,15 +326,7 @@ def start_ollama(base_url: str = "http://localhost:11434", timeout: int = 15) ->
     try:
         if system == "darwin":
             # macOS — try opening the app first (handles the service)
-            app_exists = (
-                subprocess.run(
-                    ["test", "-d", "/Applications/Ollama.app"],
-                    capture_output=True,
-                ).returncode
-                == 0
-            )
-
-            if app_exists:
+            if _has_ollama_app():
                 subprocess.Popen(
                     ["open", "-a", "Ollama"],
                     stdout=subprocess.DEVNULL,
@@ -291,13 +347,16 @@ def start_ollama(base_url: str = "http://localhost:11434", timeout: int = 15) ->
                 stderr=subprocess.DEVNULL,
             )
 
-        # Wait for it to become ready
-        for i in range(timeout):
-            time.sleep(1)
+        # Wait for it to become ready, polling quickly at first and backing off
+        delay = 0.1
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(delay)
             if is_ollama_running(base_url):
                 _mark_started_by_drift()
                 console.print("[green]  ✓ Ollama is running[/green]")
                 return True
+            delay = min(delay * 1.5, 1.0)
 
         console.print(
             "[yellow]  ⚠ Ollama started but not responding yet. Try again in a moment.[/yellow]"
@@ -313,38 +372,72 @@ def start_ollama(base_url: str = "http://localhost:11434", timeout: int = 15) ->
 
 
 def pull_model(model: str, base_url: str = "http://localhost:11434") -> bool:
-    """Pull a model using the Ollama CLI.
+    """Pull a model through the server's streaming /api/pull endpoint.
+
+    Works against remote servers too, and shows download progress as the
+    server reports it.
 
     Args:
         model: Model name (e.g. "qwen2.5-coder:1.5b").
-        base_url: Ollama server URL (unused, pulls via CLI).
+        base_url: Ollama server URL; its cached model list is dropped on success.
 
     Returns:
         True if the model was pulled successfully.
     """
+    from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+
+    from drift_cli.core.jsonio import loads
+
     console.print(
         f"[cyan]📥 Pulling model [bold]{model}[/bold]... (this may take a few minutes)[/cyan]"
     )
 
     try:
-        result = subprocess.run(
-            ["ollama", "pull", model],
-            timeout=600,  # 10 minute timeout for large models
-        )
-        if result.returncode == 0:
-            console.print(f"[green]  ✓ Model {model} is ready[/green]")
-            return True
+        with _probe_client().stream(
+            "POST",
+            f"{base_url}/api/pull",
+            # "name" is what older servers expect; newer ones read "model"
+            json={"model": model, "name": model, "stream": True},
+            timeout=httpx.Timeout(10.0, read=600.0),  # digest checks can be silent a while
+        ) as resp:
+            if resp.status_code != 200:
+                console.print(f"[yellow]  ⚠ Failed to pull model {model}[/yellow]")
+                return False
+            with Progress(
+                TextColumn("  {task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                console=console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task("connecting", total=None)
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    event = loads(line)
+                    if "error" in event:
+                        console.print(
+                            f"[yellow]  ⚠ Failed to pull model: {event['error']}[/yellow]"
+                        )
+                        return False
+                    progress.update(
+                        task,
+                        description=event.get("status", ""),
+                        total=event.get("total"),
+                        completed=event.get("completed", 0),
+                    )
+                    if event.get("status") == "success":
+                        _tags_cache.pop(base_url, None)  # the model list just changed
+                        console.print(f"[green]  ✓ Model {model} is ready[/green]")
+                        return True
         console.print(f"[yellow]  ⚠ Failed to pull model {model}[/yellow]")
         return False
 
-    except subprocess.TimeoutExpired:
+    except httpx.TimeoutException:
         console.print(
             f"[yellow]  ⚠ Model pull timed out. Run manually: ollama pull {model}[/yellow]"
         )
         return False
-    except FileNotFoundError:
-        console.print("[yellow]  ⚠ Ollama binary not found. Install it first.[/yellow]")
-        return False
     except Exception as e:
         console.print(f"[yellow]  ⚠ Failed to pull model: {e}[/yellow]")
         return False
@@ -372,13 +465,16 @@ def ensure_ollama_ready(
     Returns:
         True if Ollama is fully ready (installed, running, model available).
     """
+    status = probe_ollama(model, base_url)
+
     # Step 1: Is Ollama installed?
-    if not is_ollama_installed():
+    if not status.installed:
         if auto_install:
             if not install_ollama():
                 return False
             # Re-check after install
-            if not is_ollama_installed():
+            status = probe_ollama(model, base_url)
+            if not status.installed:
                 console.print("[red]✗ Ollama installation could not be verified[/red]")
                 return False
         else:
@@ -389,11 +485,12 @@ def ensure_ollama_ready(
             return False
 
     # Step 2: Is Ollama running?
-    if not is_ollama_running(base_url):
+    if not status.running:
         _clear_started_by_drift_marker()
         if auto_start:
             if not start_ollama(base_url):
                 return False
+            status.model_ready = is_model_available(model, base_url)
         else:
             console.print("[red]✗ Ollama is not running[/red]")
             console.print("  Start with: ollama serve")
@@ -401,7 +498,7 @@ def ensure_ollama_ready(
             return False
 
     # Step 3: Is the model available?
-    if not is_model_available(model, base_url):
+    if not status.model_ready:
         if auto_pull:
             if not pull_model(model, base_url):
                 return False
@@ -1,13 +1,50 @@
 """Configuration management for Drift CLI."""
 
-import json
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from drift_cli.core.jsonio import dumps_pretty, loads
 
+_TRUE = frozenset({"1", "true", "yes", "on"})
+_FALSE = frozenset({"0", "false", "no", "off"})
 
-class DriftConfig(BaseModel):
+
+def _coerce(kind: type, value: Any) -> Any:
+    """Convert a JSON value to a field's type, raising ValueError if it does not fit.
+
+    Mirrors the lax-but-lossless rules pydantic applied: null is never a value,
+    ints must be whole (12.7 is rejected rather than truncated), and strings are
+    accepted for numbers and booleans only when they parse cleanly.
+    """
+    if value is None:
+        raise ValueError("null is not a valid setting")
+    if kind is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    elif kind is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            return int(value.strip())
+    elif kind is float:
+        if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+            return float(value)
+    elif kind is str:
+        if isinstance(value, str):
+            return value
+    raise ValueError(f"{value!r} is not a valid {kind.__name__}")
+
+
+@dataclass
+class DriftConfig:
     """Configuration for Drift CLI."""
 
     model: str = "qwen2.5-coder:1.5b"
@@ -20,7 +57,21 @@ class DriftConfig(BaseModel):
     auto_start_ollama: bool = True
     auto_pull_model: bool = True
     auto_stop_ollama_when_idle: bool = False
-    ollama_idle_minutes: int = Field(30, ge=1, le=1440)
+    ollama_idle_minutes: int = 30
+
+    def __post_init__(self):
+        if not 1 <= self.ollama_idle_minutes <= 1440:
+            raise ValueError("ollama_idle_minutes must be between 1 and 1440")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DriftConfig":
+        """Build a config from parsed JSON, coercing values and ignoring unknown keys."""
+        return cls(**{f.name: _coerce(f.type, data[f.name]) for f in fields(cls) if f.name in data})
+
+    @property
+    def resolved_model(self) -> str:
+        """Model to use: $DRIFT_MODEL overrides the configured one."""
+        return os.getenv("DRIFT_MODEL", self.model)
 
 
 class ConfigManager:
@@ -32,20 +83,15 @@ class ConfigManager:
 
     def load(self) -> DriftConfig:
         """Load configuration from file or return defaults."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
-                return DriftConfig(**data)
-            except Exception:
-                # If config is corrupted, return defaults
-                return DriftConfig()
-        return DriftConfig()
+        try:
+            return DriftConfig.from_dict(loads(self.config_path.read_bytes()))
+        except Exception:
+            # Missing or corrupted config falls back to defaults
+            return DriftConfig()
 
     def save(self, config: DriftConfig):
         """Save configuration to file."""
-        with open(self.config_path, "w") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        self.config_path.write_bytes(dumps_pretty(config))
 
     def update(self, **kwargs):
         """Update specific config values."""
@@ -54,3 +100,24 @@ class ConfigManager:
             if hasattr(config, key):
                 setattr(config, key, value)
         self.save(config)
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> DriftConfig:
+    return ConfigManager(Path(path)).load()
+
+
+def load_config(config_path: Optional[Path] = None) -> DriftConfig:
+    """
+    Load configuration, parsing the file only when it has changed.
+
+    The parsed config is cached on the file's mtime and size, so repeated calls
+    in one process are a single stat, while saved edits are picked up immediately.
+    The returned object is shared; treat it as read-only.
+    """
+    path = config_path or Path.home() / ".drift" / "config.json"
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _load_config_cached(str(path), 0, -1)
+    return _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
@@ -7,8 +7,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
-from drift_cli.core.config import ConfigManager
-from drift_cli.core.history import HistoryManager
+from drift_cli.core.config import load_config
+from drift_cli.core.history import HistoryManager, get_history_manager
 from drift_cli.core.safety import SafetyChecker
 from drift_cli.models import Plan
 
@@ -17,11 +17,9 @@ class Executor:
     """Executes commands safely with snapshots and rollback support."""
 
     def __init__(self, history_manager: Optional[HistoryManager] = None):
-        self.history = history_manager or HistoryManager()
+        self.history = history_manager or get_history_manager()
         self.executor_mode = os.getenv("DRIFT_EXECUTOR", "local")  # mock, local, docker
         self.sandbox_root = os.getenv("DRIFT_SANDBOX_ROOT")  # Optional sandbox directory
-        self._context_cache = None
-        self._context_cache_time = 0
 
     def execute_plan(self, plan: Plan, dry_run: bool = False) -> Tuple[int, str, Optional[str]]:
         """
@@ -39,8 +37,7 @@ class Executor:
             dry_run = True
 
         # Validate safety
-        commands_list = [cmd.command for cmd in plan.commands]
-        all_safe, warnings = SafetyChecker.validate_commands(commands_list)
+        all_safe, warnings = SafetyChecker.validate_commands(cmd.command for cmd in plan.commands)
 
         if not all_safe:
             return 1, "\n".join(warnings), None
@@ -80,13 +77,17 @@ class Executor:
                         output_lines.append(f"Command failed with exit code {code}")
                         break
 
+        if not dry_run and self.executor_mode != "mock":
+            # Commands may have created or moved repositories
+            invalidate_context()
+
         return exit_code, "\n".join(output_lines), snapshot_id
 
     @staticmethod
     def _auto_snapshot_enabled() -> bool:
         """Read auto-snapshot preference from config, defaulting to enabled."""
         try:
-            return ConfigManager().load().auto_snapshot
+            return load_config().auto_snapshot
         except Exception:
             return True
 
@@ -167,47 +168,55 @@ class Executor:
 
     def get_context(self) -> str:
         """
-        Get current execution context for the LLM with caching.
+        Get current execution context for the LLM.
+
+        Cached per process, keyed on cwd and the shell environment, so
+        repeated calls only shell out to git once per directory.
 
         Returns:
             Context string with cwd, user, etc.
         """
-        import time
-
-        # Cache context for 5 seconds to avoid repeated git calls
-        current_time = time.time()
-        if self._context_cache and (current_time - self._context_cache_time) < 5:
-            return self._context_cache
-
-        context_parts = [
-            f"Current directory: {os.getcwd()}",
-            f"User: {os.getenv('USER', 'unknown')}",
-            f"Shell: {os.getenv('SHELL', 'unknown')}",
-        ]
-
-        # Add git info if in a git repo
-        git_root = self._get_git_root()
-        if git_root:
-            context_parts.append(f"Git repository: {git_root}")
-
-        self._context_cache = "\n".join(context_parts)
-        self._context_cache_time = current_time
-
-        return self._context_cache
-
-    @lru_cache(maxsize=1)
-    def _get_git_root(self) -> Optional[str]:
-        """Get git root with caching (cached until process restart)."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        return _build_context(
+            os.getcwd(), os.getenv("USER", "unknown"), os.getenv("SHELL", "unknown")
+        )
+
+
+@lru_cache(maxsize=4)
+def _build_context(cwd: str, user: str, shell: str) -> str:
+    context_parts = [
+        f"Current directory: {cwd}",
+        f"User: {user}",
+        f"Shell: {shell}",
+    ]
+
+    # Add git info if in a git repo
+    git_root = _get_git_root(cwd)
+    if git_root:
+        context_parts.append(f"Git repository: {git_root}")
+
+    return "\n".join(context_parts)
+
+
+@lru_cache(maxsize=8)
+def _get_git_root(cwd: str) -> Optional[str]:
+    """Get the git root for cwd, cached until invalidated."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=False,
+            cwd=cwd,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return None
+
+
+def invalidate_context() -> None:
+    """Drop cached context, e.g. after commands that may change git state."""
+    _build_context.cache_clear()
+    _get_git_root.cache_clear()
@@ -1,15 +1,8 @@
 """First-run setup wizard for Drift CLI."""
 
-from pathlib import Path
+import os
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm
-
-from drift_cli.core.auto_setup import ensure_ollama_ready
-from drift_cli.core.config import ConfigManager, DriftConfig
-
-console = Console()
+from drift_cli.core.paths import DRIFT_DIR
 
 WELCOME_ART = """[bold cyan]
      ╔══════════════════════════════════════╗
@@ -17,12 +10,10 @@ WELCOME_ART = """[bold cyan]
      ║   Terminal AI assistant for humans   ║
      ╚══════════════════════════════════════╝[/bold cyan]"""
 
-DRIFT_DIR = Path.home() / ".drift"
-
 
 def is_first_run() -> bool:
     """Check if this is the first time Drift is run."""
-    return not DRIFT_DIR.exists()
+    return not os.path.exists(DRIFT_DIR)
 
 
 def run_setup_wizard():
@@ -31,18 +22,24 @@ def run_setup_wizard():
     Creates ~/.drift, saves default config, and optionally
     installs/starts Ollama and pulls the default model.
     """
-    console.print(WELCOME_ART)
-    console.print()
-    console.print("  Drift turns natural language into shell commands")
-    console.print("  with built-in safety checks and undo support.")
-    console.print()
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    from drift_cli.core.auto_setup import ensure_ollama_ready
+    from drift_cli.core.config import ConfigManager, DriftConfig
+
+    # Created here: every drift invocation imports this module for is_first_run()
+    console = Console()
     console.print(
-        "[dim]  Powered by local LLMs via Ollama — your data stays on your machine.[/dim]"
+        f"{WELCOME_ART}\n\n"
+        "  Drift turns natural language into shell commands\n"
+        "  with built-in safety checks and undo support.\n\n"
+        "[dim]  Powered by local LLMs via Ollama — your data stays on your machine.[/dim]\n"
     )
-    console.print()
 
     # Create config directory
-    DRIFT_DIR.mkdir(parents=True, exist_ok=True)
+    os.makedirs(DRIFT_DIR, exist_ok=True)
 
     # Save default config
     cm = ConfigManager()
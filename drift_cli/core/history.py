@@ -1,25 +1,84 @@
 """History and snapshot management with improved safety and performance."""
 
+import atexit
+import gzip
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from drift_cli.models import HistoryEntry, Plan
 
 
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of regular files under path, in a single scandir walk."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def count_snapshots(snapshots_dir: str, stop_after: Optional[int] = None) -> int:
+    """
+    Count snapshot directories with one readdir pass and no per-entry stat.
+
+    Counting stops early once it exceeds stop_after; a missing directory
+    counts as zero.
+    """
+    count = 0
+    try:
+        with os.scandir(snapshots_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    count += 1
+                    if stop_after is not None and count > stop_after:
+                        break
+    except FileNotFoundError:
+        return 0
+    return count
+
+
+@lru_cache(maxsize=4)
+def _read_history(path: str, limit: int, mtime_ns: int, size: int) -> Tuple[HistoryEntry, ...]:
+    entries = []
+    with open(path, "r") as f:
+        lines = f.readlines()
+    for line in reversed(lines[-limit:]):
+        try:
+            data = json.loads(line)
+            entries.append(HistoryEntry(**data))
+        except (json.JSONDecodeError, ValueError):
+            continue
+    return tuple(entries)
+
+
 class HistoryManager:
     """Manages command history and file snapshots with size limits and rotation."""
 
     MAX_HISTORY_SIZE_MB = 10  # Max size for history.jsonl before rotation
     MAX_CONTEXT_SIZE_MB = 5  # Max size for context.json before cleanup
+    BATCH_SIZE = 64  # Max queued entries before an early flush
 
     def __init__(self, drift_dir: Optional[Path] = None):
         self.drift_dir = drift_dir or Path.home() / ".drift"
         self.history_file = self.drift_dir / "history.jsonl"
         self.snapshots_dir = self.drift_dir / "snapshots"
+        self._pending: List[str] = []
+        self._flush_registered = False
 
         # Ensure directories exist
         self.drift_dir.mkdir(exist_ok=True)
@@ -87,16 +146,15 @@ class HistoryManager:
             # Path resolution failed (e.g., too many symlinks)
             return False
 
-    def add_entry(
-        self,
+    @staticmethod
+    def _make_entry(
         query: str,
         plan: Plan,
-        executed: bool = False,
-        exit_code: Optional[int] = None,
-        snapshot_id: Optional[str] = None,
+        executed: bool,
+        exit_code: Optional[int],
+        snapshot_id: Optional[str],
     ) -> HistoryEntry:
-        """Add an entry to the history."""
-        entry = HistoryEntry(
+        return HistoryEntry(
             timestamp=datetime.now().isoformat(),
             query=query,
             plan=plan,
@@ -105,27 +163,75 @@ class HistoryManager:
             snapshot_id=snapshot_id,
         )
 
+    def add_entry(
+        self,
+        query: str,
+        plan: Plan,
+        executed: bool = False,
+        exit_code: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> HistoryEntry:
+        """Add an entry to the history."""
+        entry = self._make_entry(query, plan, executed, exit_code, snapshot_id)
+
         with open(self.history_file, "a") as f:
             f.write(entry.model_dump_json() + "\n")
 
         return entry
 
-    def get_history(self, limit: int = 10) -> List[HistoryEntry]:
-        """Get recent history entries."""
-        if not self.history_file.exists():
-            return []
+    def queue_entry(
+        self,
+        query: str,
+        plan: Plan,
+        executed: bool = False,
+        exit_code: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> HistoryEntry:
+        """
+        Queue an entry to be written in a batch.
 
-        entries = []
-        with open(self.history_file, "r") as f:
-            lines = f.readlines()
-            for line in reversed(lines[-limit:]):
-                try:
-                    data = json.loads(line)
-                    entries.append(HistoryEntry(**data))
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        Queued entries are appended with a single write, either once
+        BATCH_SIZE accumulate or when the process exits. Use add_entry when
+        the record must be on disk immediately.
+        """
+        entry = self._make_entry(query, plan, executed, exit_code, snapshot_id)
+
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+        self._pending.append(entry.model_dump_json() + "\n")
+        if len(self._pending) >= self.BATCH_SIZE:
+            self.flush()
+
+        return entry
+
+    def flush(self):
+        """Write any queued entries to the history file."""
+        if not self._pending:
+            return
 
-        return entries
+        pending, self._pending = self._pending, []
+        try:
+            with open(self.history_file, "a") as f:
+                f.writelines(pending)
+        except OSError:
+            # History is best-effort; never fail the command on exit
+            pass
+
+    def get_history(self, limit: int = 10) -> List[HistoryEntry]:
+        """
+        Get recent history entries.
+
+        Parsed entries are cached on the file's mtime and size, so repeated
+        reads in one process skip JSON parsing until the file changes. The
+        entries themselves are shared; treat them as read-only.
+        """
+        self.flush()
+        try:
+            st = os.stat(self.history_file)
+        except OSError:
+            return []
+        return list(_read_history(str(self.history_file), limit, st.st_mtime_ns, st.st_size))
 
     def get_last_entry(self) -> Optional[HistoryEntry]:
         """Get the most recent history entry."""
@@ -151,17 +257,14 @@ class HistoryManager:
             "timestamp": datetime.now().isoformat(),
             "files": [],
             "size_bytes": 0,
+            "compressed": True,
         }
 
         total_size = 0
         for file_path in files:
             path = Path(file_path).expanduser().resolve()
 
-            # Validate file exists
-            if not path.exists():
-                continue
-
-            # Skip if not a regular file
+            # Skip missing paths and anything that isn't a regular file
             if not path.is_file():
                 continue
 
@@ -173,12 +276,17 @@ class HistoryManager:
                 # File is outside home directory
                 target = snapshot_dir / "external" / path.name
 
+            target = target.with_name(target.name + ".gz")
             target.parent.mkdir(parents=True, exist_ok=True)
 
             try:
-                shutil.copy2(path, target)
-                file_size = path.stat().st_size
-                total_size += file_size
+                # Fast gzip level: snapshots are mostly source/config text
+                with open(path, "rb") as src, gzip.open(target, "wb", compresslevel=1) as dst:
+                    file_size = os.fstat(src.fileno()).st_size
+                    shutil.copyfileobj(src, dst)
+                shutil.copystat(path, target)
+                # Track bytes on disk, so cleanup reports what it actually frees
+                total_size += target.stat().st_size
                 metadata["files"].append(
                     {"original": str(path), "snapshot": str(target), "size_bytes": file_size}
                 )
@@ -245,7 +353,12 @@ class HistoryManager:
 
                 if snapshot.exists() and snapshot.is_file():
                     original.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(snapshot, original)
+                    if metadata.get("compressed"):
+                        with gzip.open(snapshot, "rb") as src, open(original, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                        shutil.copystat(snapshot, original)
+                    else:
+                        shutil.copy2(snapshot, original)
                     restored_count += 1
 
             return restored_count > 0
@@ -255,22 +368,31 @@ class HistoryManager:
     def list_snapshots(self) -> List[dict]:
         """List all available snapshots."""
         snapshots = []
-        for snapshot_dir in self.snapshots_dir.iterdir():
-            if not snapshot_dir.is_dir():
-                continue
+        with os.scandir(self.snapshots_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
 
-            metadata_file = snapshot_dir / "metadata.json"
-            if metadata_file.exists():
                 try:
-                    with open(metadata_file, "r") as f:
-                        metadata = json.load(f)
-                        snapshots.append(metadata)
+                    with open(os.path.join(entry.path, "metadata.json"), "r") as f:
+                        snapshots.append(json.load(f))
                 except Exception:
                     continue
 
         return sorted(snapshots, key=lambda x: x["timestamp"], reverse=True)
 
-    def cleanup_old_snapshots(self, keep: int = 10, max_age_days: int = 30) -> int:
+    def _snapshot_size(self, snapshot: dict) -> int:
+        """Size recorded at creation; older snapshots without one are walked."""
+        size = snapshot.get("size_bytes")
+        if isinstance(size, int):
+            return size
+        return _dir_size(self.snapshots_dir / snapshot["id"])
+
+    def get_snapshots_size(self) -> int:
+        """Total size in bytes of all snapshots, read from their metadata."""
+        return sum(self._snapshot_size(snapshot) for snapshot in self.list_snapshots())
+
+    def cleanup_old_snapshots(self, keep: int = 10, max_age_days: int = 30) -> Tuple[int, int]:
         """
         Clean up old snapshots to save disk space.
 
@@ -279,18 +401,20 @@ class HistoryManager:
             max_age_days: Delete snapshots older than this many days
 
         Returns:
-            Number of snapshots deleted
+            Tuple of (snapshots_deleted, bytes_freed)
         """
         snapshots = self.list_snapshots()
         deleted = 0
+        freed = 0
 
         if len(snapshots) <= keep:
-            return 0
+            return 0, 0
 
         from datetime import timedelta
 
         cutoff_time = datetime.now() - timedelta(days=max_age_days)
 
+        doomed = []
         for idx, snapshot in enumerate(snapshots):
             # Always keep the 'keep' most recent
             if idx < keep:
@@ -300,10 +424,38 @@ class HistoryManager:
             try:
                 snap_time = datetime.fromisoformat(snapshot["timestamp"])
                 if snap_time < cutoff_time:
-                    snapshot_dir = self.snapshots_dir / snapshot["id"]
-                    shutil.rmtree(snapshot_dir)
-                    deleted += 1
+                    doomed.append(snapshot)
             except Exception:
                 pass
 
-        return deleted
+        if not doomed:
+            return 0, 0
+
+        def _remove(snapshot: dict) -> Optional[int]:
+            # Sizing (a stat walk for legacy snapshots) happens on the worker
+            # too, so those stats overlap with other deletions
+            try:
+                size = self._snapshot_size(snapshot)
+                shutil.rmtree(self.snapshots_dir / snapshot["id"])
+                return size
+            except OSError:
+                return None
+
+        # Unlinks and stats release the GIL, so a few workers overlap the I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(doomed))) as pool:
+            for size in pool.map(_remove, doomed):
+                if size is not None:
+                    deleted += 1
+                    freed += size
+
+        return deleted, freed
+
+
+@lru_cache(maxsize=4)
+def _shared_history(drift_dir: str) -> HistoryManager:
+    return HistoryManager(Path(drift_dir))
+
+
+def get_history_manager() -> HistoryManager:
+    """Process-wide HistoryManager for the current home directory."""
+    return _shared_history(str(Path.home() / ".drift"))
@@ -0,0 +1,30 @@
+"""JSON helpers that use orjson when it is installed, and the stdlib otherwise."""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as indented, UTF-8 encoded JSON; dataclasses are written as objects."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_default).encode("utf-8")
@@ -8,15 +8,21 @@ This module learns from user interactions to provide:
 - Preference learning
 """
 
+import hashlib
 import json
+import os
 from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from drift_cli.models import HistoryEntry, RiskLevel
 
+# Bump when the layout of the rendered memory pack changes
+MEMORY_PACK_VERSION = 1
+
 
 @dataclass
 class UserPreference:
@@ -357,6 +363,8 @@ class MemoryManager:
             executed: Whether user chose to execute
             success: Whether execution succeeded (only relevant if executed=True)
         """
+        before = asdict(self.preferences)
+
         if executed:
             # Learn about successful tools
             if success:
@@ -380,7 +388,9 @@ class MemoryManager:
                     # Keep only most recent 10 avoided patterns
                     self.preferences.avoided_patterns = self.preferences.avoided_patterns[-10:]
 
-        self._save_preferences()
+        # Only touch disk (and change the memory pack hash) on a real change
+        if asdict(self.preferences) != before:
+            self._save_preferences()
 
     def update_context(
         self,
@@ -447,42 +457,50 @@ class MemoryManager:
 
         self._save_context()
 
-    def enhance_prompt_with_context(self, base_context: str) -> str:
+    def render_memory_pack(self) -> str:
         """
-        Enhance base context with memory insights.
+        Render learned preferences as a deterministic, versioned block.
 
-        This is called before sending query to LLM to make it aware
-        of user preferences and patterns.
+        Identical memory state always renders byte-identical text, so the
+        block can sit in the cached prompt prefix. Per-call details such as
+        recent queries belong in get_recent_activity() instead.
         """
-        enhancements = []
+        entries = []
 
-        # Add user preferences
         if self.preferences.favorite_tools:
             tools = ", ".join(self.preferences.favorite_tools[:5])
-            enhancements.append(f"User's preferred tools: {tools}")
+            entries.append(f"User's preferred tools: {tools}")
 
         if self.preferences.comfortable_with_high_risk:
-            enhancements.append("User is comfortable with higher-risk operations")
+            entries.append("User is comfortable with higher-risk operations")
         else:
-            enhancements.append("User prefers conservative, safer approaches")
+            entries.append("User prefers conservative, safer approaches")
 
-        # Add current project context
         if self.context.detected_project_type:
-            enhancements.append(f"Detected project: {self.context.detected_project_type}")
+            entries.append(f"Detected project: {self.context.detected_project_type}")
 
         if self.context.current_git_branch:
-            enhancements.append(f"Git branch: {self.context.current_git_branch}")
+            entries.append(f"Git branch: {self.context.current_git_branch}")
 
-        # Add recent patterns
-        if self.context.recent_queries:
-            recent = self.context.recent_queries[-2:]
-            enhancements.append(f"Recent queries: {', '.join(recent)}")
+        body = "\n".join(f"- {entry}" for entry in entries)
+        digest = hashlib.md5(body.encode("utf-8")).hexdigest()[:12]
+        return f"# mem:v{MEMORY_PACK_VERSION}:{digest}\n{body}"
 
-        if enhancements:
-            personalization = "\n".join(f"- {entry}" for entry in enhancements)
-            return f"{base_context}\n\nPERSONALIZATION CONTEXT:\n{personalization}"
+    def get_recent_activity(self, exclude: Optional[str] = None) -> str:
+        """Recent session activity, leaving out `exclude` (usually the current query)."""
+        recent = [q for q in self.context.recent_queries if q != exclude][-2:]
+        if not recent:
+            return ""
+        return f"Recent queries: {', '.join(recent)}"
 
-        return base_context
+    def enhance_prompt_with_context(self, base_context: str) -> str:
+        """
+        Enhance base context with memory insights.
+
+        This is called before sending query to LLM to make it aware
+        of user preferences and patterns.
+        """
+        return f"{base_context}\n\nPERSONALIZATION CONTEXT:\n{self.render_memory_pack()}"
 
     def get_personalized_prompt_context(self) -> str:
         """
@@ -575,6 +593,34 @@ class MemoryManager:
 
         return suggestions
 
+    def resolve_clarifications(self, questions: List) -> Optional[Dict[int, Tuple[str, str]]]:
+        """
+        Answer clarification questions from learned preferences.
+
+        Only multiple-choice questions whose options name one of the user's
+        favorite tools can be answered; the highest-ranked tool wins.
+
+        Returns:
+            (option, tool) pairs keyed by question index, or None if any
+            question still needs the user.
+        """
+        answers = {}
+        for idx, q in enumerate(questions):
+            if not q.options:
+                return None
+            choice = None
+            for tool in self.preferences.favorite_tools:
+                for option in q.options:
+                    if tool in option.lower().split():
+                        choice = (option, tool)
+                        break
+                if choice:
+                    break
+            if choice is None:
+                return None
+            answers[idx] = choice
+        return answers
+
     def get_smart_defaults(self) -> Dict:
         """
         Return smart defaults based on user preferences.
@@ -662,6 +708,16 @@ class MemoryManager:
         self._save_preferences()
 
 
+@lru_cache(maxsize=4)
+def _shared_memory(drift_dir: str, cwd: str) -> MemoryManager:
+    return MemoryManager(Path(drift_dir))
+
+
+def get_memory_manager() -> MemoryManager:
+    """Process-wide MemoryManager for the current home and working directory."""
+    return _shared_memory(str(Path.home() / ".drift"), os.getcwd())
+
+
 def enhance_prompt_with_memory(base_prompt: str, memory: MemoryManager) -> str:
     """
     Enhance a base prompt with memory/context.
@@ -6,13 +6,17 @@ from typing import Optional
 import httpx
 from pydantic import ValidationError
 
-from drift_cli.core.memory import MemoryManager, enhance_prompt_with_memory
+from drift_cli.core.memory import MemoryManager, enhance_prompt_with_memory, get_memory_manager
 from drift_cli.models import Plan
 
 
 class OllamaClient:
     """Client for interacting with local Ollama API."""
 
+    # Keep the model (and its prompt KV cache) loaded between calls so a
+    # clarification round-trip can reuse the already-processed prefix.
+    KEEP_ALIVE = "10m"
+
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
@@ -21,8 +25,20 @@ class OllamaClient:
     ):
         self.base_url = base_url
         self.model = model
-        self.client = httpx.Client(timeout=60.0)
-        self.memory = memory or MemoryManager()
+        # One pooled connection serves the plan call and any clarification
+        # follow-up, so only the first request pays for the TCP handshake.
+        self.client = httpx.Client(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=1, keepalive_expiry=30.0),
+        )
+        self._memory = memory
+
+    @property
+    def memory(self) -> MemoryManager:
+        """Memory used for personalization, loaded on the first plan request."""
+        if self._memory is None:
+            self._memory = get_memory_manager()
+        return self._memory
 
     def is_available(self) -> bool:
         """Check if Ollama is running and accessible."""
@@ -32,13 +48,24 @@ class OllamaClient:
         except Exception:
             return False
 
-    def get_plan(self, query: str, context: Optional[str] = None, use_memory: bool = True) -> Plan:
+    def get_plan(
+        self,
+        query: str,
+        system_context: Optional[str] = None,
+        extra_context: str = "",
+        use_memory: bool = True,
+    ) -> Plan:
         """
         Get a plan from Ollama for the given query.
 
+        The system prompt and `system_context` form a stable prefix; only the
+        query and `extra_context` vary between calls, so Ollama can serve the
+        prefix from its KV cache on follow-up requests.
+
         Args:
             query: User's natural language query
-            context: Additional context (cwd, recent commands, etc.)
+            system_context: Stable context (cwd, user, personalization, etc.)
+            extra_context: Per-call additions, e.g. clarification answers
             use_memory: Whether to enhance prompt with learned user preferences
 
         Returns:
@@ -54,8 +81,8 @@ class OllamaClient:
         if use_memory and self.memory:
             self.memory.update_context(query=sanitized_query)
 
-        system_prompt = self._build_system_prompt()
-        user_prompt = self._build_user_prompt(sanitized_query, context)
+        system_prompt = self._build_system_prompt(system_context)
+        user_prompt = self._build_user_prompt(sanitized_query, extra_context)
 
         # Enhance with memory if enabled
         if use_memory and self.memory:
@@ -68,9 +95,11 @@ class OllamaClient:
                     f"{self.base_url}/api/generate",
                     json={
                         "model": self.model,
-                        "prompt": f"{system_prompt}\n\n{user_prompt}",
+                        "system": system_prompt,
+                        "prompt": user_prompt,
                         "format": "json",
                         "stream": False,
+                        "keep_alive": self.KEEP_ALIVE,
                         "options": {
                             "temperature": 0.1,
                             "top_p": 0.9,
@@ -148,9 +177,9 @@ Be concise but thorough."""
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to get explanation: {e}")
 
-    def _build_system_prompt(self) -> str:
-        """Build the system prompt for the LLM."""
-        return """You are Drift, a terminal assistant.
+    def _build_system_prompt(self, context: Optional[str] = None) -> str:
+        """Build the system prompt for the LLM, followed by the stable context."""
+        prompt = """You are Drift, a terminal assistant.
 Convert natural language queries into safe, executable shell commands.
 
 CRITICAL: You MUST respond with ONLY valid JSON matching this exact schema:
@@ -175,7 +204,8 @@ CRITICAL: You MUST respond with ONLY valid JSON matching this exact schema:
 }
 
 RULES:
-1. If the query is ambiguous, use "clarification_needed" field with questions
+1. If the query is ambiguous, use "clarification_needed" field with questions,
+   and still fill "commands" with your best guess
 2. Always assess risk accurately (destructive ops = high, modifications = medium, reads = low)
 3. Provide dry-run commands when possible (e.g., add -n flag for dry runs)
 4. Be conservative: when uncertain, ask for clarification
@@ -185,14 +215,17 @@ RULES:
 8. Keep commands readable and well-explained
 
 Respond with ONLY the JSON object, no other text."""
-
-    def _build_user_prompt(self, query: str, context: Optional[str] = None) -> str:
-        """Build the user prompt with query and context."""
-        prompt = f"User query: {query}"
         if context:
             prompt += f"\n\nContext:\n{context}"
         return prompt
 
+    def _build_user_prompt(self, query: str, extra_context: str = "") -> str:
+        """Build the user prompt with the query and any per-call context."""
+        prompt = f"User query: {query}"
+        if extra_context:
+            prompt += f"\n\n{extra_context}"
+        return prompt
+
     def _sanitize_input(self, text: str) -> str:
         """
         Sanitize user input to prevent prompt injection attacks.
@@ -219,3 +252,9 @@ Respond with ONLY the JSON object, no other text."""
     def close(self):
         """Close the HTTP client."""
         self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
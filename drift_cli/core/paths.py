@@ -0,0 +1,10 @@
+"""Well-known Drift locations, resolved once at import time."""
+
+import os
+
+HOME = os.path.expanduser("~")
+DRIFT_DIR = os.path.join(HOME, ".drift")
+SNAPSHOTS_DIR = os.path.join(DRIFT_DIR, "snapshots")
+CACHE_DB = os.path.join(DRIFT_DIR, "cache.db")
+ZSHRC = os.path.join(HOME, ".zshrc")
+CLEANUP_STAMP = os.path.join(DRIFT_DIR, ".last_cleanup_check")
@@ -0,0 +1,101 @@
+"""Persistent cache of LLM responses, so repeated queries skip the model."""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """Small sqlite-backed key/value cache with TTL and size-capped eviction."""
+
+    DEFAULT_TTL = 3600  # seconds
+    MAX_ENTRIES = 500
+    PURGE_EVERY = 50  # inserts between purges, so the table stays capped
+
+    def __init__(self, drift_dir: Optional[Path] = None):
+        self.drift_dir = drift_dir or Path.home() / ".drift"
+        self.db_path = self.drift_dir / "cache.db"
+
+        self.drift_dir.mkdir(parents=True, exist_ok=True)
+        # A corrupt or locked cache.db must not break suggest; run uncached instead
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            conn = sqlite3.connect(str(self.db_path))
+        except sqlite3.Error:
+            return
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+        except sqlite3.Error:
+            conn.close()
+            return
+        self._conn = conn
+
+    @staticmethod
+    def make_key(*parts: str) -> bytes:
+        """Hash the parts that determine a response into a fixed-size key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def get(self, key: bytes, ttl: int = DEFAULT_TTL) -> Optional[str]:
+        """Return the cached value if it is younger than ttl seconds."""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND ts > ?",
+                (key, int(time.time()) - ttl),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: bytes, value: str):
+        """Store a value; failures are ignored since the cache is best-effort."""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                rowid = self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)",
+                    (key, value, int(time.time())),
+                ).lastrowid
+        except sqlite3.Error:
+            return
+        if rowid and rowid % self.PURGE_EVERY == 0:
+            self.purge()
+
+    def purge(self, max_age: int = DEFAULT_TTL) -> int:
+        """
+        Drop expired entries and evict the oldest beyond MAX_ENTRIES.
+
+        Returns:
+            Number of entries removed
+        """
+        if self._conn is None:
+            return 0
+        try:
+            with self._conn:
+                expired = self._conn.execute(
+                    "DELETE FROM responses WHERE ts <= ?", (int(time.time()) - max_age,)
+                ).rowcount
+                evicted = self._conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY ts DESC LIMIT ?)",
+                    (self.MAX_ENTRIES,),
+                ).rowcount
+        except sqlite3.Error:
+            return 0
+        return expired + evicted
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
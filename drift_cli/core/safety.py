@@ -1,11 +1,19 @@
 """Safety module for validating and scoring commands with improved patterns."""
 
 import re
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from drift_cli.models import RiskLevel
 
 
+def _compile_union(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile patterns into one alternation; group pN marks patterns[N]."""
+    return re.compile(
+        "|".join(f"(?P<p{idx}>{pattern})" for idx, pattern in enumerate(patterns)),
+        re.IGNORECASE,
+    )
+
+
 class SafetyChecker:
     """Validates commands for safety and assigns risk levels."""
 
@@ -95,6 +103,11 @@ class SafetyChecker:
         r">>",  # Append redirection
     ]
 
+    # Each list scanned in a single pass per command
+    _BLOCKED_RE = _compile_union(HARD_BLOCKLIST)
+    _HIGH_RISK_RE = _compile_union(HIGH_RISK_PATTERNS)
+    _MEDIUM_RISK_RE = _compile_union(MEDIUM_RISK_PATTERNS)
+
     @classmethod
     def is_blocked(cls, command: str) -> Tuple[bool, str]:
         """
@@ -103,9 +116,10 @@ class SafetyChecker:
         Returns:
             Tuple of (is_blocked, reason)
         """
-        for pattern in cls.HARD_BLOCKLIST:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True, f"Blocked: dangerous pattern detected ({pattern[:30]}...)"
+        match = cls._BLOCKED_RE.search(command)
+        if match:
+            pattern = cls.HARD_BLOCKLIST[int(match.lastgroup[1:])]
+            return True, f"Blocked: dangerous pattern detected ({pattern[:30]}...)"
         return False, ""
 
     @classmethod
@@ -121,21 +135,19 @@ class SafetyChecker:
             return RiskLevel.HIGH
 
         # Check high risk patterns
-        for pattern in cls.HIGH_RISK_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return RiskLevel.HIGH
+        if cls._HIGH_RISK_RE.search(command):
+            return RiskLevel.HIGH
 
         # Check medium risk patterns
-        for pattern in cls.MEDIUM_RISK_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return RiskLevel.MEDIUM
+        if cls._MEDIUM_RISK_RE.search(command):
+            return RiskLevel.MEDIUM
 
         return RiskLevel.LOW
 
     @classmethod
-    def validate_commands(cls, commands: List[str]) -> Tuple[bool, List[str]]:
+    def validate_commands(cls, commands: Iterable[str]) -> Tuple[bool, List[str]]:
         """
-        Validate a list of commands.
+        Validate commands; any iterable works and is consumed once.
 
         Returns:
             Tuple of (all_safe, list_of_warnings)
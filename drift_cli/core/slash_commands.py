@@ -13,7 +13,7 @@ import subprocess
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from drift_cli.core.memory import MemoryManager
+from drift_cli.core.memory import MemoryManager, get_memory_manager
 
 
 @dataclass
@@ -270,9 +270,16 @@ class SlashCommandHandler:
 
     def __init__(self, memory: Optional[MemoryManager] = None):
         """Initialize handler with optional memory for personalization."""
-        self.memory = memory or MemoryManager()
+        self._memory = memory
         self.registry = SlashCommandRegistry()
 
+    @property
+    def memory(self) -> MemoryManager:
+        """Memory used for personalization, loaded only when a command needs it."""
+        if self._memory is None:
+            self._memory = get_memory_manager()
+        return self._memory
+
     def is_slash_command(self, query: str) -> bool:
         """Check if query is a slash command."""
         return query.strip().startswith("/")
@@ -289,8 +296,8 @@ class SlashCommandHandler:
             "/find *.py" -> ("/find", "*.py")
             "/port 3000" -> ("/port", "3000")
         """
-        parts = query.strip().split(maxsplit=1)
-        command = parts[0].lower()
+        parts = query.split(maxsplit=1)
+        command = parts[0].lower() if parts else ""
         args = parts[1] if len(parts) > 1 else ""
         return command, args
 
@@ -342,7 +349,7 @@ class SlashCommandHandler:
                 check=False,
             )
             if result.returncode == 0:
-                changes = result.stdout.strip().split("\n") if result.stdout.strip() else []
+                changes = result.stdout.strip().splitlines()
                 context["uncommitted_files"] = len(changes)
                 context["has_changes"] = len(changes) > 0
 
@@ -354,7 +361,7 @@ class SlashCommandHandler:
                 check=False,
             )
             if result.returncode == 0:
-                commits = result.stdout.strip().split("\n") if result.stdout.strip() else []
+                commits = result.stdout.strip().splitlines()
                 context["unpushed_commits"] = len(commits)
 
             # Staged files
@@ -365,7 +372,7 @@ class SlashCommandHandler:
                 check=False,
             )
             if result.returncode == 0:
-                staged = result.stdout.strip().split("\n") if result.stdout.strip() else []
+                staged = result.stdout.strip().splitlines()
                 context["staged_files"] = len(staged)
 
         except Exception:
@@ -423,10 +430,10 @@ class SlashCommandHandler:
         If is_slash_command is False, return original query.
         If error_message is not None, command failed validation.
         """
-        if not self.is_slash_command(query):
-            return False, query, None
-
+        # Strip and split once; the checks below all work on the parsed parts
         command_name, args = self.parse_slash_command(query)
+        if not command_name.startswith("/"):
+            return False, query, None
 
         if command_name == "/help":
             return True, "", None  # Will be handled specially by CLI
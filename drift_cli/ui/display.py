@@ -3,10 +3,6 @@
 from typing import List
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-from rich.text import Text
 
 from drift_cli.models import Plan, RiskLevel
 
@@ -31,6 +27,9 @@ class DriftUI:
     @classmethod
     def show_plan(cls, plan: Plan, query: str, show_explanation: bool = False):
         """Display a plan with rich formatting."""
+        from rich.panel import Panel
+        from rich.table import Table
+
         console.print()
 
         # Risk badge
@@ -76,6 +75,8 @@ class DriftUI:
     @classmethod
     def confirm_execution(cls, risk: RiskLevel) -> bool:
         """Ask user to confirm execution."""
+        from rich.prompt import Confirm, Prompt
+
         if risk == RiskLevel.HIGH:
             console.print("[bold red]⚠️  HIGH RISK — review commands carefully[/bold red]")
             response = Prompt.ask(
@@ -89,6 +90,8 @@ class DriftUI:
     @classmethod
     def show_execution_result(cls, exit_code: int, output: str):
         """Display execution results."""
+        from rich.panel import Panel
+
         if exit_code == 0:
             console.print("[bold green]✓ Done[/bold green]")
         else:
@@ -121,6 +124,8 @@ class DriftUI:
     @classmethod
     def ask_clarification(cls, questions: List) -> dict:
         """Ask clarification questions and return answers."""
+        from rich.prompt import Prompt
+
         console.print("[bold yellow]Need clarification:[/bold yellow]\n")
 
         answers = {}
@@ -143,6 +148,11 @@ class DriftUI:
     @classmethod
     def show_history(cls, entries: List):
         """Display command history."""
+        from datetime import datetime
+
+        from rich.table import Table
+        from rich.text import Text
+
         if not entries:
             console.print("[dim]No history yet.[/dim]")
             return
@@ -158,8 +168,6 @@ class DriftUI:
             style = "green" if entry.executed else "dim"
 
             try:
-                from datetime import datetime
-
                 dt = datetime.fromisoformat(entry.timestamp)
                 time_str = dt.strftime("%Y-%m-%d %H:%M")
             except Exception:
@@ -1,8 +1,17 @@
+import json
+from contextlib import contextmanager
 from types import SimpleNamespace
 
+import pytest
+
 import drift_cli.core.auto_setup as auto_setup
 
 
+@pytest.fixture(autouse=True)
+def _fresh_tags_cache(monkeypatch):
+    monkeypatch.setattr(auto_setup, "_tags_cache", {})
+
+
 def test_install_ollama_macos_uses_consistent_archive_path(monkeypatch):
     monkeypatch.setattr(auto_setup.platform, "system", lambda: "Darwin")
     monkeypatch.setattr(auto_setup.shutil, "which", lambda _: None)
@@ -15,11 +24,10 @@ def test_install_ollama_macos_uses_consistent_archive_path(monkeypatch):
             return SimpleNamespace(returncode=0, stdout="", stderr="")
         if cmd[:2] == ["unzip", "-o"]:
             return SimpleNamespace(returncode=0, stdout="", stderr="")
-        if cmd[:3] == ["test", "-d", "/Applications/Ollama.app"]:
-            return SimpleNamespace(returncode=0, stdout="", stderr="")
         return SimpleNamespace(returncode=1, stdout="", stderr="")
 
     monkeypatch.setattr(auto_setup.subprocess, "run", fake_run)
+    monkeypatch.setattr(auto_setup, "_has_ollama_app", lambda: True)
 
     assert auto_setup.install_ollama() is True
 
@@ -30,6 +38,22 @@ def test_install_ollama_macos_uses_consistent_archive_path(monkeypatch):
     assert unzip_cmd[2] == "/tmp/Ollama-darwin.zip"
 
 
+def test_ollama_path_is_looked_up_once_until_install(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(auto_setup.shutil, "which", lambda name: lookups.append(name) or None)
+    monkeypatch.setattr(auto_setup.platform, "system", lambda: "Plan9")
+    auto_setup._ollama_path.cache_clear()
+
+    assert not auto_setup.is_ollama_installed()
+    assert not auto_setup.is_ollama_installed()
+    assert lookups == ["ollama"]
+
+    auto_setup.install_ollama()
+    assert not auto_setup.is_ollama_installed()
+    assert lookups == ["ollama", "ollama"]
+    auto_setup._ollama_path.cache_clear()
+
+
 def test_schedule_idle_shutdown_skips_when_disabled(monkeypatch, fake_home):
     popen_calls = []
     monkeypatch.setattr(auto_setup.subprocess, "Popen", lambda *a, **k: popen_calls.append((a, k)))
@@ -51,3 +75,137 @@ def test_schedule_idle_shutdown_requires_drift_marker(monkeypatch, fake_home):
 
     auto_setup.schedule_idle_shutdown_if_needed(enabled=True, idle_minutes=10)
     assert len(popen_calls) == 1
+
+
+def test_probes_go_through_shared_client(monkeypatch):
+    requested = []
+
+    class FakeClient:
+        def get(self, url):
+            requested.append(url)
+            return SimpleNamespace(status_code=200, json=lambda: {"models": [{"name": "m:1"}]})
+
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda client=FakeClient(): client)
+
+    assert auto_setup.is_ollama_running("http://ollama")
+    assert auto_setup.is_model_available("m:1", "http://ollama")
+    assert requested == ["http://ollama/api/tags"]
+
+
+def _pull_stream(events, requests=None):
+    """Fake client.stream() answering /api/pull with NDJSON events."""
+
+    @contextmanager
+    def stream(method, url, **kwargs):
+        if requests is not None:
+            requests.append((method, url, kwargs["json"]))
+        lines = [json.dumps(event) for event in events]
+        yield SimpleNamespace(status_code=200, iter_lines=lambda: iter(lines))
+
+    return stream
+
+
+def test_pull_model_streams_progress_from_the_server(monkeypatch):
+    requests = []
+    events = [
+        {"status": "pulling manifest"},
+        {"status": "pulling abc", "total": 100, "completed": 40},
+        {"status": "pulling abc", "total": 100, "completed": 100},
+        {"status": "success"},
+    ]
+    client = SimpleNamespace(stream=_pull_stream(events, requests))
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: client)
+    monkeypatch.setattr(auto_setup.subprocess, "run", lambda *a, **k: pytest.fail("forked"))
+
+    assert auto_setup.pull_model("m:1", "http://ollama")
+    assert [(method, url) for method, url, _ in requests] == [("POST", "http://ollama/api/pull")]
+    assert requests[0][2]["model"] == "m:1"
+
+
+def test_pull_model_reports_server_errors(monkeypatch):
+    client = SimpleNamespace(stream=_pull_stream([{"error": "pull model manifest: not found"}]))
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: client)
+
+    assert not auto_setup.pull_model("nope", "http://ollama")
+
+
+def test_tags_cache_skips_failures_and_is_dropped_after_pull(monkeypatch):
+    answers = [OSError("connection refused"), {"models": []}, {"models": [{"name": "m:1"}]}]
+
+    def fake_get(url):
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return SimpleNamespace(status_code=200, json=lambda: answer)
+
+    client = SimpleNamespace(get=fake_get, stream=_pull_stream([{"status": "success"}]))
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: client)
+
+    assert not auto_setup.is_ollama_running("http://ollama")
+    assert auto_setup.is_ollama_running("http://ollama")
+    assert not auto_setup.is_model_available("m:1", "http://ollama")
+    assert auto_setup.pull_model("m:1", "http://ollama")
+    assert auto_setup.is_model_available("m:1", "http://ollama")
+    assert answers == []
+
+
+def test_probe_ollama_answers_server_and_model_with_one_request(monkeypatch):
+    requested = []
+
+    def fake_get(url):
+        requested.append(url)
+        return SimpleNamespace(status_code=200, json=lambda: {"models": [{"name": "m:latest"}]})
+
+    monkeypatch.setattr(auto_setup, "is_ollama_installed", lambda: pytest.fail("PATH scanned"))
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: SimpleNamespace(get=fake_get))
+
+    status = auto_setup.probe_ollama("m", "http://ollama")
+
+    assert (status.installed, status.running, status.model_ready) == (True, True, True)
+    assert requested == ["http://ollama/api/tags"]
+
+
+def test_probe_ollama_checks_path_only_when_server_is_down(monkeypatch):
+    def refused(url):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(auto_setup, "is_ollama_installed", lambda: True)
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: SimpleNamespace(get=refused))
+
+    status = auto_setup.probe_ollama("m", "http://ollama")
+
+    assert (status.installed, status.running, status.model_ready) == (True, False, False)
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    [
+        ("llama3", True),
+        ("llama3:8b", True),
+        ("llama3:70b", False),
+        ("llama3-gradient", False),
+        ("qwen2.5-coder:1.5b", True),
+        ("qwen2.5", False),
+    ],
+)
+def test_model_listed_matches_exact_tags_or_bare_names(model, expected):
+    tags = {"models": [{"name": "llama3:8b"}, {"name": "qwen2.5-coder:1.5b"}]}
+    assert auto_setup._model_listed(model, tags) is expected
+
+
+def test_start_ollama_polls_with_backoff(monkeypatch, fake_home):
+    now = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(round(seconds, 3))
+        now[0] += seconds
+
+    monkeypatch.setattr(auto_setup.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(auto_setup.subprocess, "Popen", lambda *a, **k: None)
+    monkeypatch.setattr(auto_setup.time, "sleep", fake_sleep)
+    monkeypatch.setattr(auto_setup.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(auto_setup, "is_ollama_running", lambda url: len(sleeps) == 3)
+
+    assert auto_setup.start_ollama("http://ollama", timeout=15)
+    assert sleeps == [0.1, 0.15, 0.225]
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+
+def test_version_imports_only_its_command_module(fake_home):
+    (fake_home / ".drift").mkdir()
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from drift_cli.cli import app\n"
+        "result = CliRunner().invoke(app, ['version'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print(sorted(m for m in sys.modules if m.startswith('drift_cli.commands.')))\n"
+        "print(sorted(m for m in ('rich', 'httpx', 'pydantic') if m in sys.modules))\n"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.splitlines()[-2:] == ["['drift_cli.commands.system_cmd']", "[]"]
+
+
+def test_preprocess_argv_joins_query_words_after_flags(monkeypatch):
+    from drift_cli import cli
+
+    monkeypatch.setattr(sys, "argv", ["drift", "suggest", "-d", "list", "big", "-v", "files"])
+    cli._preprocess_argv()
+
+    assert sys.argv == ["drift", "suggest", "-d", "-v", "list big files"]
+
+
+def test_preprocess_argv_routes_bare_queries_to_suggest(monkeypatch):
+    from drift_cli import cli
+
+    monkeypatch.setattr(sys, "argv", ["drift", "list", "large", "files"])
+    cli._preprocess_argv()
+    assert sys.argv == ["drift", "suggest", "list large files"]
+
+    monkeypatch.setattr(sys, "argv", ["drift", "--help"])
+    cli._preprocess_argv()
+    assert sys.argv == ["drift", "--help"]
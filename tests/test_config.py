@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+
+from drift_cli.core import config as config_module
+from drift_cli.core.config import load_config
+
+
+def test_load_config_reparses_only_when_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"model": "first"}))
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    loads = []
+    real_load = config_module.ConfigManager.load
+
+    def counting_load(self):
+        loads.append(self.config_path)
+        return real_load(self)
+
+    monkeypatch.setattr(config_module.ConfigManager, "load", counting_load)
+
+    assert load_config(path).model == "first"
+    assert load_config(path).model == "first"
+    assert len(loads) == 1
+
+    path.write_text(json.dumps({"model": "second"}))
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert load_config(path).model == "second"
+    assert len(loads) == 2
+
+    # Same mtime (coarse timestamps, quick rewrites) but a different size
+    path.write_text(json.dumps({"model": "third-model"}))
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert load_config(path).model == "third-model"
+    assert len(loads) == 3
+
+
+def test_resolved_model_prefers_environment(monkeypatch):
+    from drift_cli.core.config import DriftConfig
+
+    monkeypatch.delenv("DRIFT_MODEL", raising=False)
+    assert DriftConfig(model="configured").resolved_model == "configured"
+
+    monkeypatch.setenv("DRIFT_MODEL", "override")
+    assert DriftConfig(model="configured").resolved_model == "override"
+
+
+def test_load_coerces_values_and_falls_back_on_bad_ranges(tmp_path):
+    from drift_cli.core.config import ConfigManager, DriftConfig
+
+    path = tmp_path / "config.json"
+    manager = ConfigManager(path)
+    path.write_text(
+        json.dumps({"temperature": "0.5", "auto_snapshot": "false", "max_history": 7, "x": 1})
+    )
+
+    config = manager.load()
+    assert (config.temperature, config.auto_snapshot, config.max_history) == (0.5, False, 7)
+
+    path.write_text(json.dumps({"model": "custom", "ollama_idle_minutes": 0}))
+    assert manager.load() == DriftConfig()
+
+    manager.save(config)
+    assert manager.load() == config
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"model": None},
+        {"model": 5},
+        {"max_history": 12.7},
+        {"max_history": "12.7"},
+        {"temperature": "abc"},
+        {"auto_snapshot": "maybe"},
+        {"auto_snapshot": 2},
+    ],
+)
+def test_from_dict_rejects_lossy_values(data):
+    from drift_cli.core.config import DriftConfig
+
+    with pytest.raises(ValueError):
+        DriftConfig.from_dict(data)
+
+
+def test_from_dict_accepts_clean_conversions():
+    from drift_cli.core.config import DriftConfig
+
+    config = DriftConfig.from_dict(
+        {"max_history": " 12 ", "temperature": 1, "top_p": "0.5", "auto_snapshot": 0}
+    )
+    assert (config.max_history, config.temperature, config.top_p) == (12, 1.0, 0.5)
+    assert config.auto_snapshot is False
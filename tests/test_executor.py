@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from drift_cli.core.executor import Executor
 from drift_cli.core.history import HistoryManager
 
@@ -50,3 +52,33 @@ def test_snapshot_respects_auto_snapshot_setting(tmp_path, make_plan, monkeypatc
     monkeypatch.setattr(Executor, "_auto_snapshot_enabled", staticmethod(lambda: True))
     _, _, enabled_snapshot = executor.execute_plan(plan, dry_run=False)
     assert enabled_snapshot is not None
+
+
+def test_get_context_is_cached_per_directory(tmp_path, monkeypatch):
+    import drift_cli.core.executor as executor_module
+
+    calls = []
+    monkeypatch.setattr(
+        executor_module.subprocess,
+        "run",
+        lambda args, **kwargs: (
+            calls.append(kwargs["cwd"]) or SimpleNamespace(returncode=1, stdout="")
+        ),
+    )
+    executor_module.invalidate_context()
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    executor = Executor(history_manager=HistoryManager(drift_dir=tmp_path / "drift"))
+
+    monkeypatch.chdir(first)
+    assert executor.get_context() == executor.get_context()
+    monkeypatch.chdir(second)
+    assert f"Current directory: {second}" in executor.get_context()
+    assert calls == [str(first), str(second)]
+
+    executor_module.invalidate_context()
+    executor.get_context()
+    assert len(calls) == 3
+    executor_module.invalidate_context()
@@ -1,6 +1,9 @@
 import json
+import shutil
 
-from drift_cli.core.history import HistoryManager
+import pytest
+
+from drift_cli.core.history import HistoryManager, _dir_size, count_snapshots
 
 
 def test_add_and_get_history_order(tmp_path, make_plan):
@@ -38,3 +41,183 @@ def test_restore_snapshot_rejects_unsafe_identifier(tmp_path):
     assert history.restore_snapshot("../evil") is False
     assert history.restore_snapshot(".hidden") is False
     assert history.restore_snapshot("") is False
+
+
+def test_cleanup_old_snapshots_reports_freed_bytes(tmp_path):
+    history = HistoryManager(drift_dir=tmp_path / "drift")
+
+    for idx in range(3):
+        snapshot_dir = history.snapshots_dir / f"snap-{idx}"
+        snapshot_dir.mkdir()
+        (snapshot_dir / "data.txt").write_text("x" * 100)
+        metadata = {"id": f"snap-{idx}", "timestamp": f"2020-01-0{idx + 1}T00:00:00"}
+        (snapshot_dir / "metadata.json").write_text(json.dumps(metadata))
+
+    total_before = history.get_snapshots_size()
+    deleted, freed = history.cleanup_old_snapshots(keep=1, max_age_days=30)
+
+    assert deleted == 2
+    assert freed > 200
+    assert history.get_snapshots_size() == total_before - freed
+    assert [p.name for p in history.snapshots_dir.iterdir()] == ["snap-2"]
+
+
+def test_cleanup_skips_snapshots_that_fail_to_delete(tmp_path, monkeypatch):
+    history = HistoryManager(drift_dir=tmp_path / "drift")
+
+    for idx in range(3):
+        snapshot_dir = history.snapshots_dir / f"snap-{idx}"
+        snapshot_dir.mkdir()
+        (snapshot_dir / "data.txt").write_text("x" * 100)
+        metadata = {"id": f"snap-{idx}", "timestamp": f"2020-01-0{idx + 1}T00:00:00"}
+        (snapshot_dir / "metadata.json").write_text(json.dumps(metadata))
+
+    real_rmtree = shutil.rmtree
+
+    def flaky_rmtree(path, *args, **kwargs):
+        if str(path).endswith("snap-0"):
+            raise PermissionError(path)
+        real_rmtree(path, *args, **kwargs)
+
+    monkeypatch.setattr(shutil, "rmtree", flaky_rmtree)
+    deleted, _ = history.cleanup_old_snapshots(keep=1, max_age_days=30)
+
+    assert deleted == 1
+    assert sorted(p.name for p in history.snapshots_dir.iterdir()) == ["snap-0", "snap-2"]
+
+
+def test_queued_entries_are_batched_until_flush(tmp_path, make_plan):
+    history = HistoryManager(drift_dir=tmp_path)
+    history.queue_entry("first", make_plan("echo 1"), executed=False)
+    history.queue_entry("second", make_plan("echo 2"), executed=True, exit_code=0)
+
+    assert not history.history_file.exists()
+
+    history.flush()
+    lines = history.history_file.read_text().splitlines()
+    assert [json.loads(line)["query"] for line in lines] == ["first", "second"]
+
+
+def test_exit_flush_is_registered_once_across_batches(monkeypatch, tmp_path, make_plan):
+    import drift_cli.core.history as history_module
+
+    registered = []
+    monkeypatch.setattr(history_module.atexit, "register", registered.append)
+    history = HistoryManager(drift_dir=tmp_path)
+
+    for i in range(HistoryManager.BATCH_SIZE * 2 + 1):
+        history.queue_entry(f"q{i}", make_plan(), executed=False)
+
+    assert registered == [history.flush]
+    assert len(history.history_file.read_text().splitlines()) == HistoryManager.BATCH_SIZE * 2
+
+
+def test_get_history_sees_queued_entries(tmp_path, make_plan):
+    history = HistoryManager(drift_dir=tmp_path)
+    history.queue_entry("pending", make_plan(), executed=False)
+
+    assert history.get_last_entry().query == "pending"
+
+
+def test_dir_size_counts_nested_files_without_following_links(tmp_path):
+    history = HistoryManager(drift_dir=tmp_path / "drift")
+    nested = history.snapshots_dir / "snap" / "a" / "b"
+    nested.mkdir(parents=True)
+    (nested / "file.txt").write_bytes(b"x" * 100)
+    (history.snapshots_dir / "snap" / "top.txt").write_bytes(b"y" * 20)
+
+    outside = tmp_path / "big.bin"
+    outside.write_bytes(b"z" * 10_000)
+    (history.snapshots_dir / "snap" / "link").symlink_to(outside)
+
+    assert _dir_size(history.snapshots_dir) == 120
+
+
+def test_snapshots_size_uses_recorded_metadata(fake_home, monkeypatch):
+    import drift_cli.core.history as history_module
+
+    history = HistoryManager()
+    target = fake_home / "notes.txt"
+    target.write_text("x" * 4200)
+    snapshot_id = history.create_snapshot([str(target)])
+    stored = history.snapshots_dir / snapshot_id / "notes.txt.gz"
+
+    monkeypatch.setattr(
+        history_module, "_dir_size", lambda path: pytest.fail("snapshot tree was walked")
+    )
+
+    assert history.get_snapshots_size() == stored.stat().st_size
+
+
+def test_count_snapshots_counts_directories_only(tmp_path):
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "stray.txt").write_text("")
+
+    assert count_snapshots(str(tmp_path)) == 3
+    assert count_snapshots(str(tmp_path), stop_after=1) == 2
+    assert count_snapshots(str(tmp_path / "missing")) == 0
+
+
+def test_history_manager_is_shared_per_home(fake_home, tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from drift_cli.core.history import get_history_manager
+
+    first = get_history_manager()
+    assert get_history_manager() is first
+    assert first.drift_dir == fake_home / ".drift"
+
+    other_home = tmp_path / "other"
+    other_home.mkdir()
+    monkeypatch.setattr(Path, "home", lambda: other_home)
+    assert get_history_manager() is not first
+
+
+def test_snapshots_are_compressed_and_legacy_copies_still_restore(fake_home):
+    history = HistoryManager()
+    source = fake_home / "big.txt"
+    source.write_text("line\n" * 1000)
+
+    snapshot_id = history.create_snapshot([str(source)])
+    stored = history.snapshots_dir / snapshot_id / "big.txt.gz"
+    assert stored.stat().st_size < source.stat().st_size
+
+    # Snapshots written before compression hold plain copies
+    legacy_dir = history.snapshots_dir / "legacy"
+    legacy_dir.mkdir()
+    (legacy_dir / "big.txt").write_text("legacy")
+    (legacy_dir / "metadata.json").write_text(
+        json.dumps(
+            {
+                "id": "legacy",
+                "timestamp": "2024-01-01T00:00:00",
+                "files": [{"original": str(source), "snapshot": str(legacy_dir / "big.txt")}],
+            }
+        )
+    )
+
+    assert history.restore_snapshot("legacy") is True
+    assert source.read_text() == "legacy"
+    assert history.restore_snapshot(snapshot_id) is True
+    assert source.read_text() == "line\n" * 1000
+
+
+def test_get_history_reuses_parse_until_file_changes(tmp_path, make_plan, monkeypatch):
+    import drift_cli.core.history as history_module
+
+    history = HistoryManager(drift_dir=tmp_path)
+    history.add_entry("first", make_plan())
+
+    parses = []
+    real_loads = json.loads
+    monkeypatch.setattr(history_module.json, "loads", lambda s: parses.append(s) or real_loads(s))
+
+    assert [e.query for e in history.get_history(limit=5)] == ["first"]
+    assert [e.query for e in history.get_history(limit=5)] == ["first"]
+    assert len(parses) == 1
+
+    history.add_entry("second", make_plan())
+
+    assert [e.query for e in history.get_history(limit=5)] == ["second", "first"]
+    assert len(parses) == 3
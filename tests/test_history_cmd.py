@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pytest
+
+import drift_cli.core.history as history
+from drift_cli.commands import history_cmd
+
+
+def test_cancelled_cleanup_never_walks_snapshot_tree(monkeypatch, fake_home):
+    snapshots = fake_home / "snapshots"
+    for name in ("a", "b", "c"):
+        (snapshots / name).mkdir(parents=True)
+
+    monkeypatch.setattr(history_cmd, "SNAPSHOTS_DIR", str(snapshots))
+    monkeypatch.setattr(history_cmd.typer, "confirm", lambda *a, **k: False)
+    monkeypatch.setattr(history, "_dir_size", lambda path: pytest.fail("tree was walked"))
+
+    history_cmd.cleanup(keep=1, days=30, auto=False)
+
+
+def test_cleanup_reports_remaining_without_recounting(monkeypatch, fake_home):
+    snapshots = fake_home / "snapshots"
+    for name in ("a", "b", "c"):
+        (snapshots / name).mkdir(parents=True)
+
+    counts = []
+    real_count = history.count_snapshots
+
+    def counting(*args, **kwargs):
+        counts.append(args)
+        return real_count(*args, **kwargs)
+
+    messages = []
+    fake_history = SimpleNamespace(cleanup_old_snapshots=lambda **kw: (2, 2048))
+    monkeypatch.setattr(history_cmd, "SNAPSHOTS_DIR", str(snapshots))
+    monkeypatch.setattr(history, "count_snapshots", counting)
+    monkeypatch.setattr(history, "get_history_manager", lambda: fake_history)
+    monkeypatch.setattr("drift_cli.ui.display.DriftUI.show_success", messages.append)
+
+    history_cmd.cleanup(keep=1, days=30, auto=True)
+
+    assert len(counts) == 1
+    assert messages and messages[0].endswith("(1 remaining)")
@@ -0,0 +1,36 @@
+import pytest
+
+from drift_cli.core import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_pretty_dump_round_trips_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+
+    data = {"tools": ["rg", "fd"], "name": "café", "nested": {"n": 1}}
+    payload = jsonio.dumps_pretty(data)
+
+    assert isinstance(payload, bytes)
+    assert b"\n  " in payload
+    assert jsonio.loads(payload) == data
+    assert jsonio.loads(payload.decode("utf-8")) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_pretty_dump_writes_dataclasses_as_objects(monkeypatch, use_orjson):
+    from drift_cli.core.memory import UserPreference
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+
+    prefs = UserPreference(favorite_tools=["git"], common_sequences=[["git add", "git commit"]])
+    data = jsonio.loads(jsonio.dumps_pretty({"preferences": prefs}))
+
+    assert data["preferences"]["favorite_tools"] == ["git"]
+    assert data["preferences"]["common_sequences"] == [["git add", "git commit"]]
+    assert data["preferences"]["prefers_dry_run"] is True
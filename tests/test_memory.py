@@ -57,3 +57,50 @@ def test_update_context_detects_python_project(fake_home, monkeypatch):
 
     assert memory.context.detected_project_type == "python"
     assert memory.context.recent_queries[-1] == "run tests"
+
+
+def test_memory_pack_is_stable_across_queries(fake_home, monkeypatch):
+    monkeypatch.chdir(fake_home)
+    memory = MemoryManager(drift_dir=fake_home / ".drift", use_project_memory=False)
+
+    memory.update_context(query="list files")
+    first = memory.render_memory_pack()
+    memory.update_context(query="show disk usage")
+
+    assert memory.render_memory_pack() == first
+    assert first.startswith("# mem:v1:")
+    assert "show disk usage" in memory.get_recent_activity()
+
+    memory.preferences.favorite_tools = ["rg"]
+    assert memory.render_memory_pack() != first
+
+
+def test_resolve_clarifications_uses_favorite_tools(tmp_path):
+    from drift_cli.models import ClarificationQuestion
+
+    memory = MemoryManager(drift_dir=tmp_path / "drift", use_project_memory=False)
+    memory.preferences.favorite_tools = ["rg", "grep"]
+
+    tool_question = ClarificationQuestion(
+        question="Which search tool?", options=["grep -r", "rg", "find"]
+    )
+    open_question = ClarificationQuestion(question="Which directory?")
+
+    assert memory.resolve_clarifications([tool_question]) == {0: ("rg", "rg")}
+    assert memory.resolve_clarifications([tool_question, open_question]) is None
+
+
+def test_memory_manager_is_shared_per_home_and_directory(fake_home, tmp_path, monkeypatch):
+    from drift_cli.core.memory import get_memory_manager
+
+    first_dir = tmp_path / "one"
+    second_dir = tmp_path / "two"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    monkeypatch.chdir(first_dir)
+    shared = get_memory_manager()
+    assert get_memory_manager() is shared
+
+    monkeypatch.chdir(second_dir)
+    assert get_memory_manager() is not shared
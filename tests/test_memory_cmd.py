@@ -0,0 +1,99 @@
+import json
+from types import SimpleNamespace
+
+import drift_cli.core.memory as memory_module
+from drift_cli.commands import memory_cmd
+
+
+def test_list_projects_loads_files_in_order_and_skips_bad_ones(monkeypatch, tmp_path):
+    for name in ("beta", "alpha"):
+        data = {"project": name, "preferences": {"favorite_tools": ["rg"]}}
+        if name == "alpha":
+            data["last_updated"] = "2024-05-01T12:34:56.789012"
+        (tmp_path / f"{name}.json").write_text(json.dumps(data))
+    (tmp_path / "broken.json").write_text("{not json")
+
+    rows = []
+    monkeypatch.setattr(
+        memory_module, "get_memory_manager", lambda: SimpleNamespace(projects_dir=tmp_path)
+    )
+    monkeypatch.setattr("rich.table.Table.add_row", lambda self, *cells: rows.append(cells))
+
+    memory_cmd.list_projects()
+
+    assert rows == [("alpha", "2024-05-01 12:34", "1", "0"), ("beta", "Unknown", "1", "0")]
+
+
+def test_show_stats_counts_in_one_pass(monkeypatch, make_plan):
+    import drift_cli.core.history as history
+    from drift_cli.models import HistoryEntry, RiskLevel
+
+    entries = [
+        HistoryEntry(timestamp="t", query="a", plan=make_plan(), executed=True, exit_code=0),
+        HistoryEntry(
+            timestamp="t",
+            query="b",
+            plan=make_plan(risk=RiskLevel.HIGH),
+            executed=True,
+            exit_code=1,
+        ),
+        HistoryEntry(timestamp="t", query="c", plan=make_plan(), executed=False),
+    ]
+    rows = []
+    fake_history = SimpleNamespace(get_history=lambda limit: entries)
+    monkeypatch.setattr(history, "get_history_manager", lambda: fake_history)
+    printed = []
+    monkeypatch.setattr("rich.table.Table.add_row", lambda self, *cells: rows.append(cells))
+    monkeypatch.setattr(memory_cmd.console, "print", lambda *args: printed.append(args))
+
+    memory_cmd.show_stats()
+
+    assert len(printed) == 1
+
+    assert ("Total Queries", "3") in rows
+    assert ("Commands Executed", "2") in rows
+    assert ("Successful", "1") in rows
+    assert ("LOW", "1", "50.0%") in rows
+    assert ("HIGH", "1", "50.0%") in rows
+
+
+def test_import_merge_dedupes_in_stable_order(monkeypatch, tmp_path):
+    from drift_cli.core.memory import MemoryManager, UserPreference
+
+    memory = MemoryManager(drift_dir=tmp_path / "drift", use_project_memory=False)
+    memory.preferences = UserPreference(
+        favorite_tools=["git", "rg"], common_sequences=[["git", "add"]]
+    )
+    monkeypatch.setattr(memory_module, "get_memory_manager", lambda: memory)
+    monkeypatch.setattr(memory, "_save_preferences", lambda: None)
+
+    import_file = tmp_path / "import.json"
+    prefs = {
+        "comfortable_with_high_risk": False,
+        "favorite_tools": ["fd", "git"],
+        "avoided_patterns": ["rm -rf"],
+        "common_sequences": [["git", "add"], ["git", "commit"]],
+    }
+    import_file.write_text(json.dumps({"version": "1.0", "preferences": prefs}))
+
+    memory_cmd.import_memory(str(import_file), merge=True)
+
+    assert memory.preferences.favorite_tools == ["git", "rg", "fd"]
+    assert memory.preferences.avoided_patterns == ["rm -rf"]
+    assert memory.preferences.common_sequences == [["git", "add"], ["git", "commit"]]
+
+
+def test_export_reports_payload_size(monkeypatch, tmp_path):
+    from drift_cli.core.memory import MemoryManager, UserPreference
+
+    memory = MemoryManager(drift_dir=tmp_path / "drift", use_project_memory=False)
+    memory.preferences = UserPreference(favorite_tools=["git"])
+    monkeypatch.setattr(memory_module, "get_memory_manager", lambda: memory)
+    printed = []
+    monkeypatch.setattr(memory_cmd.console, "print", lambda msg="": printed.append(msg))
+
+    out = tmp_path / "export" / "memory.json"
+    memory_cmd.export_memory(str(out))
+
+    assert json.loads(out.read_text())["preferences"]["favorite_tools"] == ["git"]
+    assert f"File size: {out.stat().st_size} bytes" in printed[-1]
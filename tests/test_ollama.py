@@ -0,0 +1,71 @@
+import json
+from types import SimpleNamespace
+
+from drift_cli.core.memory import MemoryManager
+from drift_cli.core.ollama import OllamaClient
+
+
+def _plan_response():
+    plan = {
+        "summary": "list files",
+        "risk": "low",
+        "commands": [{"command": "ls", "description": "list"}],
+        "explanation": "lists files",
+    }
+    return SimpleNamespace(
+        raise_for_status=lambda: None,
+        json=lambda: {"response": json.dumps(plan)},
+    )
+
+
+def test_get_plan_keeps_context_in_stable_prefix(tmp_path, monkeypatch):
+    memory = MemoryManager(drift_dir=tmp_path / "drift", use_project_memory=False)
+    client = OllamaClient(memory=memory)
+
+    bodies = []
+
+    def fake_post(url, json=None, **kwargs):
+        bodies.append(json)
+        return _plan_response()
+
+    monkeypatch.setattr(client.client, "post", fake_post)
+
+    client.get_plan("list files", "Current directory: /tmp", use_memory=False)
+    client.get_plan(
+        "list files",
+        "Current directory: /tmp",
+        extra_context="Clarifications:\nQ: hidden?\nA: yes\n",
+        use_memory=False,
+    )
+    client.close()
+
+    first, second = bodies
+    assert first["system"] == second["system"]
+    assert first["system"].endswith("Context:\nCurrent directory: /tmp")
+    assert "Clarifications" not in second["system"]
+    assert second["prompt"].startswith("User query: list files")
+    assert "A: yes" in second["prompt"]
+    assert first["keep_alive"] == OllamaClient.KEEP_ALIVE
+
+
+def test_client_closes_connection_pool_on_exit(tmp_path):
+    memory = MemoryManager(drift_dir=tmp_path / "drift", use_project_memory=False)
+
+    with OllamaClient(memory=memory) as client:
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
+
+
+def test_client_defers_memory_until_needed(monkeypatch):
+    import drift_cli.core.ollama as ollama_module
+
+    created = []
+    monkeypatch.setattr(ollama_module, "get_memory_manager", lambda: created.append(1) or "memory")
+
+    with OllamaClient() as client:
+        assert created == []
+        assert client.memory == "memory"
+        assert client.memory == "memory"
+
+    assert created == [1]
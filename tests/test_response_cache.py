@@ -0,0 +1,48 @@
+from drift_cli.core.response_cache import ResponseCache
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = ResponseCache(drift_dir=tmp_path)
+    key = cache.make_key("model", "context", "list files")
+
+    assert cache.get(key) is None
+    cache.set(key, "plan")
+    assert cache.get(key) == "plan"
+    assert cache.get(cache.make_key("model", "context", "list dirs")) is None
+    cache.close()
+
+
+def test_set_keeps_the_table_capped(monkeypatch, tmp_path):
+    monkeypatch.setattr(ResponseCache, "MAX_ENTRIES", 5)
+    monkeypatch.setattr(ResponseCache, "PURGE_EVERY", 10)
+    cache = ResponseCache(drift_dir=tmp_path)
+
+    for i in range(30):
+        cache.set(cache.make_key(str(i)), "plan")
+    (count,) = cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+
+    assert count <= ResponseCache.MAX_ENTRIES + ResponseCache.PURGE_EVERY
+    cache.close()
+
+
+def test_expired_entries_are_ignored_and_purged(tmp_path):
+    cache = ResponseCache(drift_dir=tmp_path)
+    key = cache.make_key("explain", "ls -la")
+    cache.set(key, "lists files")
+
+    assert cache.get(key, ttl=0) is None
+    assert cache.purge(max_age=0) == 1
+    assert cache.get(key) is None
+    cache.close()
+
+
+def test_corrupt_database_degrades_to_no_cache(tmp_path):
+    (tmp_path / "cache.db").write_bytes(b"this is not a sqlite database" * 100)
+
+    cache = ResponseCache(drift_dir=tmp_path)
+    key = cache.make_key("model", "context", "list files")
+    cache.set(key, "plan")
+
+    assert cache.get(key) is None
+    assert cache.purge() == 0
+    cache.close()
@@ -18,3 +18,15 @@ def test_validate_commands_emits_warnings():
     all_safe, warnings = SafetyChecker.validate_commands(["ls", "git push"])
     assert all_safe is True
     assert any("MEDIUM RISK" in warning for warning in warnings)
+
+
+def test_blocked_reason_names_the_matching_pattern():
+    blocked, reason = SafetyChecker.is_blocked("DD if=/dev/zero of=/dev/sda")
+    assert blocked is True
+    assert "dd\\s+if=" in reason
+
+
+def test_validate_commands_accepts_generator():
+    all_safe, warnings = SafetyChecker.validate_commands(c for c in ("ls", "rm -rf /"))
+    assert all_safe is False
+    assert any("BLOCKED" in warning for warning in warnings)
@@ -48,3 +48,22 @@ def test_enhance_query_includes_context(tmp_path, monkeypatch):
     assert "Current Git Status" in enhanced
     assert "- Branch: main" in enhanced
     assert "Project type: python" in enhanced
+
+
+def test_help_text_does_not_load_memory(monkeypatch):
+    import drift_cli.core.slash_commands as slash_commands
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("MemoryManager should not be constructed")
+
+    monkeypatch.setattr(slash_commands, "MemoryManager", _fail)
+    handler = SlashCommandHandler()
+
+    assert "Slash Commands" in handler.get_help_text()
+    assert handler.process_slash_command("/nope")[2] is not None
+
+
+def test_plain_and_blank_queries_pass_through(tmp_path):
+    handler = _build_handler(tmp_path)
+    assert handler.process_slash_command("list files") == (False, "list files", None)
+    assert handler.process_slash_command("   ") == (False, "   ", None)
@@ -0,0 +1,324 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from drift_cli.commands import suggest_cmd
+
+
+def test_find_runs_without_memory_and_closes_client(monkeypatch):
+    built = []
+    ran = []
+    closed = []
+
+    def fake_build_deps(no_memory=False, history=None):
+        built.append(no_memory)
+        return SimpleNamespace(close=lambda: closed.append(True))
+
+    monkeypatch.setattr(suggest_cmd, "_build_deps", fake_build_deps)
+    monkeypatch.setattr(suggest_cmd, "_run_suggest", lambda query, deps, **kw: ran.append(query))
+
+    suggest_cmd.find("large logs")
+
+    assert built == [True]
+    assert ran and ran[0].startswith("Find: large logs.")
+    assert closed == [True]
+
+
+def test_auto_cleanup_scans_snapshots_once_per_process(monkeypatch, tmp_path):
+    scans = []
+    real_listdir = os.listdir
+
+    def counting_listdir(path):
+        scans.append(path)
+        return real_listdir(path)
+
+    monkeypatch.setattr(suggest_cmd, "_cleanup_done", False)
+    monkeypatch.setattr(suggest_cmd, "SNAPSHOTS_DIR", str(tmp_path))
+    monkeypatch.setattr(suggest_cmd, "CLEANUP_STAMP", str(tmp_path.parent / "stamp"))
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+
+    suggest_cmd._auto_cleanup_snapshots()
+    suggest_cmd._auto_cleanup_snapshots()
+
+    assert scans == [str(tmp_path)]
+
+
+def test_auto_cleanup_skips_scan_after_recent_check(monkeypatch, tmp_path):
+    stamp = tmp_path / "stamp"
+    monkeypatch.setattr(suggest_cmd, "SNAPSHOTS_DIR", str(tmp_path))
+    monkeypatch.setattr(suggest_cmd, "CLEANUP_STAMP", str(stamp))
+
+    monkeypatch.setattr(suggest_cmd, "_cleanup_done", False)
+    suggest_cmd._auto_cleanup_snapshots()
+    assert stamp.exists()
+
+    # A later process within the interval only stats the stamp
+    monkeypatch.setattr(suggest_cmd, "_cleanup_done", False)
+    monkeypatch.setattr(os, "listdir", lambda path: pytest.fail("scanned"))
+    suggest_cmd._auto_cleanup_snapshots()
+
+
+def test_auto_cleanup_prunes_only_above_threshold(monkeypatch, tmp_path):
+    import drift_cli.core.history as history
+
+    pruned = []
+    fake_history = SimpleNamespace(cleanup_old_snapshots=lambda **kw: pruned.append(kw))
+    monkeypatch.setattr(history, "get_history_manager", lambda: fake_history)
+    monkeypatch.setattr(suggest_cmd, "SNAPSHOTS_DIR", str(tmp_path))
+    monkeypatch.setattr(suggest_cmd, "CLEANUP_STAMP", str(tmp_path.parent / "stamp"))
+
+    for idx in range(3):
+        (tmp_path / str(idx)).mkdir()
+    monkeypatch.setattr(suggest_cmd, "_cleanup_done", False)
+    suggest_cmd._auto_cleanup_snapshots(threshold=3)
+    assert pruned == []
+
+    (tmp_path / "3").mkdir()
+    (tmp_path.parent / "stamp").unlink()
+    monkeypatch.setattr(suggest_cmd, "_cleanup_done", False)
+    suggest_cmd._auto_cleanup_snapshots(threshold=3)
+    assert pruned == [{"keep": 50, "max_age_days": 30}]
+
+
+def test_failed_ollama_check_never_loads_memory(monkeypatch):
+    import typer
+
+    import drift_cli.core.memory as memory_module
+
+    def fail_check():
+        raise typer.Exit(1)
+
+    monkeypatch.setattr(suggest_cmd, "_auto_cleanup_snapshots", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", fail_check)
+    monkeypatch.setattr(memory_module, "get_memory_manager", lambda: pytest.fail("memory loaded"))
+
+    deps = suggest_cmd.SuggestDeps(config=None, client=None, executor=None, history=None)
+
+    with pytest.raises(typer.Exit):
+        suggest_cmd._run_suggest("list files", deps)
+
+
+def test_slash_error_never_opens_the_cache(monkeypatch):
+    import typer
+
+    import drift_cli.core.response_cache as response_cache
+
+    monkeypatch.setattr(response_cache, "ResponseCache", lambda: pytest.fail("cache opened"))
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", lambda: pytest.fail("checked ollama"))
+
+    deps = suggest_cmd.SuggestDeps(
+        config=None, client=None, executor=None, history=None, use_memory=False, use_cache=True
+    )
+
+    with pytest.raises(typer.Exit):
+        suggest_cmd._run_suggest("/no-such-command", deps)
+    deps.close()
+
+
+def test_check_ollama_runs_once_after_success(monkeypatch):
+    import drift_cli.core.auto_setup as auto_setup
+    from drift_cli.core.config import DriftConfig
+
+    checks = []
+    monkeypatch.setattr(suggest_cmd, "_ollama_verified", False)
+    monkeypatch.setattr(suggest_cmd, "_loaded_config", lambda: DriftConfig())
+    monkeypatch.setattr(auto_setup, "ensure_ollama_ready", lambda **kw: checks.append(kw) or True)
+
+    suggest_cmd._check_ollama()
+    suggest_cmd._check_ollama()
+    assert len(checks) == 1
+
+    suggest_cmd._check_ollama(force=True)
+    assert len(checks) == 2
+
+
+def test_deps_close_leaves_shared_client_open():
+    client_closed = []
+    cache_closed = []
+    deps = suggest_cmd.SuggestDeps(
+        config=None,
+        client=SimpleNamespace(close=lambda: client_closed.append(True)),
+        executor=None,
+        history=None,
+        _cache=SimpleNamespace(close=lambda: cache_closed.append(True)),
+    )
+
+    deps.close()
+
+    assert cache_closed == [True]
+    assert client_closed == []
+
+
+@pytest.mark.parametrize(
+    "query, handled",
+    [("/help", True), ("  /HELP \n", True), ("/helpme", False), ("help", False), ("/git", False)],
+)
+def test_show_local_help_matches_only_help(monkeypatch, query, handled):
+    monkeypatch.setattr(suggest_cmd.console, "print", lambda *a, **k: None)
+
+    assert suggest_cmd._show_local_help(query) is handled
+
+
+def test_clarification_replan_reuses_context_without_client_memory(monkeypatch, make_plan):
+    from drift_cli.models import ClarificationQuestion
+    from drift_cli.ui.display import DriftUI
+
+    first = make_plan().model_copy(
+        update={"clarification_needed": [ClarificationQuestion(question="Which dir?")]}
+    )
+    calls = []
+    context_calls = []
+
+    def fake_get_plan(query, system_context, extra_context="", use_memory=True):
+        calls.append((system_context, extra_context, use_memory))
+        return first if len(calls) == 1 else make_plan()
+
+    def fake_get_context():
+        context_calls.append(1)
+        return "Current directory: /tmp"
+
+    monkeypatch.setattr(suggest_cmd, "_auto_cleanup_snapshots", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_schedule_ollama_idle_shutdown", lambda: None)
+    monkeypatch.setattr(DriftUI, "ask_clarification", lambda questions: {0: "src"})
+    monkeypatch.setattr(DriftUI, "show_plan", lambda *a, **k: None)
+    monkeypatch.setattr(DriftUI, "confirm_execution", lambda risk: False)
+
+    deps = suggest_cmd.SuggestDeps(
+        config=None,
+        client=SimpleNamespace(model="m", get_plan=fake_get_plan),
+        executor=SimpleNamespace(get_context=fake_get_context),
+        history=SimpleNamespace(queue_entry=lambda *a, **k: None),
+        use_memory=False,
+    )
+
+    suggest_cmd._run_suggest("list files", deps)
+
+    assert [c[0] for c in calls] == ["Current directory: /tmp"] * 2
+    assert len(context_calls) == 1
+    assert calls[1][1].startswith("Clarifications:\n")
+    assert not any(c[2] for c in calls)
+
+
+@pytest.mark.parametrize("guess, replans", [("yarn install", False), ("npm install", True)])
+def test_memory_answer_skips_replan_only_when_the_guess_used_it(
+    monkeypatch, tmp_path, make_plan, guess, replans
+):
+    from drift_cli.core.memory import MemoryManager
+    from drift_cli.models import ClarificationQuestion
+    from drift_cli.ui.display import DriftUI
+
+    question = ClarificationQuestion(
+        question="Which package manager?", options=["Use npm", "Use yarn"]
+    )
+    learned = MemoryManager(drift_dir=tmp_path, use_project_memory=False)
+    learned.preferences.favorite_tools = ["yarn"]
+    first = make_plan(command=guess).model_copy(update={"clarification_needed": [question]})
+    calls = []
+
+    def fake_get_plan(query, system_context, extra_context="", use_memory=True):
+        calls.append(extra_context)
+        return first if len(calls) == 1 else make_plan(command="yarn install")
+
+    memory = SimpleNamespace(
+        update_context=lambda **k: None,
+        enhance_prompt_with_context=lambda context: context,
+        get_recent_activity=lambda exclude=None: "",
+        resolve_clarifications=learned.resolve_clarifications,
+        learn_from_execution=lambda *a, **k: None,
+    )
+    shown = []
+    monkeypatch.setattr(suggest_cmd, "_auto_cleanup_snapshots", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_schedule_ollama_idle_shutdown", lambda: None)
+    monkeypatch.setattr(DriftUI, "ask_clarification", lambda q: pytest.fail("asked the user"))
+    monkeypatch.setattr(DriftUI, "show_plan", lambda plan, *a, **k: shown.append(plan))
+    monkeypatch.setattr(DriftUI, "confirm_execution", lambda risk: False)
+
+    deps = suggest_cmd.SuggestDeps(
+        config=None,
+        client=SimpleNamespace(model="m", get_plan=fake_get_plan),
+        executor=SimpleNamespace(get_context=lambda: "ctx"),
+        history=SimpleNamespace(queue_entry=lambda *a, **k: None),
+        _memory=memory,
+    )
+
+    suggest_cmd._run_suggest("install deps", deps)
+
+    assert len(calls) == (2 if replans else 1)
+    if replans:
+        assert "A: Use yarn" in calls[1]
+    assert shown[0].commands[0].command == "yarn install"
+
+
+def test_plan_cache_keys_on_activity_and_stores_only_low_risk(monkeypatch, fake_home, make_plan):
+    from drift_cli.core.memory import MemoryManager
+    from drift_cli.core.response_cache import ResponseCache
+    from drift_cli.models import RiskLevel
+    from drift_cli.ui.display import DriftUI
+
+    plans = [make_plan(), make_plan(risk=RiskLevel.HIGH), make_plan()]
+    calls = []
+
+    def fake_get_plan(query, system_context, extra_context="", use_memory=True):
+        calls.append(extra_context)
+        return plans[len(calls) - 1]
+
+    drift_dir = fake_home / ".drift"
+    monkeypatch.chdir(fake_home)
+    monkeypatch.setattr(suggest_cmd, "_auto_cleanup_snapshots", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_schedule_ollama_idle_shutdown", lambda: None)
+    monkeypatch.setattr(DriftUI, "show_plan", lambda *a, **k: None)
+    monkeypatch.setattr(DriftUI, "confirm_execution", lambda risk: False)
+
+    deps = suggest_cmd.SuggestDeps(
+        config=None,
+        client=SimpleNamespace(model="m", get_plan=fake_get_plan),
+        executor=SimpleNamespace(get_context=lambda: "ctx"),
+        history=SimpleNamespace(queue_entry=lambda *a, **k: None),
+        _cache=ResponseCache(drift_dir=drift_dir),
+        _memory=MemoryManager(drift_dir=drift_dir),
+    )
+
+    suggest_cmd._run_suggest("list files", deps)  # miss, stored
+    suggest_cmd._run_suggest("list files", deps)  # same activity: hit
+    suggest_cmd._run_suggest("show disk usage", deps)  # miss, high risk: not stored
+    suggest_cmd._run_suggest("list files", deps)  # new activity: miss
+    deps.cache.close()
+
+    assert calls == [
+        "",
+        "Recent queries: list files, list files",
+        "Recent queries: show disk usage",
+    ]
+
+
+def test_unreadable_cached_plan_is_a_miss(monkeypatch, make_plan):
+    from drift_cli.ui.display import DriftUI
+
+    stored = {}
+    cache = SimpleNamespace(
+        make_key=lambda *parts: b"key",
+        get=lambda key: '{"summary": "from an older release"}',
+        set=stored.__setitem__,
+    )
+    monkeypatch.setattr(suggest_cmd, "_auto_cleanup_snapshots", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_check_ollama", lambda: None)
+    monkeypatch.setattr(suggest_cmd, "_schedule_ollama_idle_shutdown", lambda: None)
+    monkeypatch.setattr(DriftUI, "show_plan", lambda *a, **k: None)
+    monkeypatch.setattr(DriftUI, "confirm_execution", lambda risk: False)
+
+    deps = suggest_cmd.SuggestDeps(
+        config=None,
+        client=SimpleNamespace(model="m", get_plan=lambda *a, **k: make_plan()),
+        executor=SimpleNamespace(get_context=lambda: "ctx"),
+        history=SimpleNamespace(queue_entry=lambda *a, **k: None),
+        _cache=cache,
+        use_memory=False,
+    )
+
+    suggest_cmd._run_suggest("list files", deps)
+
+    assert b"key" in stored
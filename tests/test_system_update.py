@@ -60,3 +60,137 @@ def test_update_returns_when_already_up_to_date(monkeypatch):
     system_cmd.update()
 
     assert ["git", "pull", "--ff-only"] not in calls
+
+
+@pytest.mark.parametrize("diff_code, expect_pip", [(0, False), (1, True)])
+def test_update_reinstalls_only_when_packaging_changed(monkeypatch, diff_code, expect_pip):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[:3] == ["git", "rev-list", "--count"]:
+            return _result(code=0, stdout="2")
+        if cmd[:3] == ["git", "diff", "--quiet"]:
+            return _result(code=diff_code)
+        return _result(code=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr(system_cmd, "_install_matches_pyproject", lambda repo_dir: False)
+
+    system_cmd.update(force_reinstall=False)
+
+    assert ["git", "pull", "--ff-only"] in calls
+    assert any("pip" in cmd for cmd in calls) is expect_pip
+
+
+def test_doctor_probes_ollama_once(monkeypatch, fake_home):
+    import drift_cli.core.auto_setup as auto_setup
+    from drift_cli.core.config import DriftConfig
+
+    requested = []
+    which_calls = []
+
+    def fake_get(url):
+        requested.append(url)
+        return SimpleNamespace(status_code=200, json=lambda: {"models": [{"name": "m:1"}]})
+
+    monkeypatch.setenv("DRIFT_MODEL", "m:1")
+    monkeypatch.setattr(system_cmd, "_loaded_config", lambda: DriftConfig())
+    monkeypatch.setattr(auto_setup, "is_ollama_installed", lambda: which_calls.append(1) or True)
+    monkeypatch.setattr(auto_setup, "_probe_client", lambda: SimpleNamespace(get=fake_get))
+    monkeypatch.setattr(auto_setup, "_tags_cache", {})
+
+    system_cmd.doctor()
+
+    assert requested == ["http://localhost:11434/api/tags"]
+    # A responding server already proves Ollama is there
+    assert which_calls == []
+
+
+def test_doctor_reprobes_model_after_starting_ollama(monkeypatch, fake_home):
+    import drift_cli.core.auto_setup as auto_setup
+    from drift_cli.core.config import DriftConfig
+
+    model_checks = []
+
+    def _model_available(*args, **kwargs):
+        model_checks.append(args)
+        return True
+
+    monkeypatch.setattr(system_cmd, "_loaded_config", lambda: DriftConfig())
+    monkeypatch.setattr(
+        auto_setup,
+        "probe_ollama",
+        lambda *a, **k: auto_setup.OllamaStatus(installed=True, running=False, model_ready=False),
+    )
+    monkeypatch.setattr(auto_setup, "start_ollama", lambda *a, **k: True)
+    monkeypatch.setattr(auto_setup, "is_model_available", _model_available)
+    monkeypatch.setattr(
+        auto_setup, "pull_model", lambda *a, **k: pytest.fail("model should not be pulled")
+    )
+
+    system_cmd.doctor()
+
+    assert len(model_checks) == 1
+
+
+def test_zshrc_check_streams_until_match(tmp_path):
+    zshrc = tmp_path / ".zshrc"
+    zshrc.write_bytes(b"export A=1\nsource ~/.drift/drift.zsh\n" + b"\xff" * 10)
+
+    assert system_cmd._zshrc_sources_drift(str(zshrc)) is True
+
+    zshrc.write_text("export A=1\n")
+    assert system_cmd._zshrc_sources_drift(str(zshrc)) is False
+
+
+def test_install_matches_pyproject_compares_version_scripts_and_requirements(monkeypatch, tmp_path):
+    pytest.importorskip("tomllib")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nversion = "1.2.0"\ndependencies = ["rich>=13"]\n'
+        '[project.optional-dependencies]\nfast = ["orjson>=3.9"]\n'
+        '[project.scripts]\ndrift = "drift_cli.cli:main_entry"\n'
+    )
+    installed = SimpleNamespace(
+        version="1.2.0",
+        entry_points=[
+            SimpleNamespace(name="drift", value="drift_cli.cli:main_entry", group="console_scripts")
+        ],
+        requires=["rich>=13", 'orjson>=3.9; extra == "fast"'],
+    )
+    monkeypatch.setattr("importlib.metadata.distribution", lambda name: installed)
+
+    assert system_cmd._install_matches_pyproject(tmp_path)
+
+    installed.requires = ["rich>=13"]
+    assert not system_cmd._install_matches_pyproject(tmp_path)
+
+
+def test_remove_tree_in_background_moves_aside_then_detaches_rm(monkeypatch, tmp_path):
+    target = tmp_path / ".drift"
+    (target / "snapshots").mkdir(parents=True)
+    spawned = []
+    monkeypatch.setattr(
+        "subprocess.Popen", lambda cmd, **kwargs: spawned.append((cmd, kwargs["start_new_session"]))
+    )
+
+    system_cmd._remove_tree_in_background(str(target))
+
+    assert not target.exists()
+    [(cmd, detached)] = spawned
+    assert cmd[:2] == ["rm", "-rf"] and cmd[2].startswith(f"{target}.uninstall-")
+    assert detached
+
+
+def test_remove_tree_in_background_falls_back_without_rm(monkeypatch, tmp_path):
+    target = tmp_path / ".drift"
+    (target / "snapshots").mkdir(parents=True)
+
+    def no_rm(cmd, **kwargs):
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr("subprocess.Popen", no_rm)
+
+    system_cmd._remove_tree_in_background(str(target))
+
+    assert list(tmp_path.iterdir()) == []